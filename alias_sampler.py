@@ -0,0 +1,61 @@
+import numpy as np
+
+
+class AliasSampler:
+    """Weighted sampling in constant time using Vose's alias method.
+
+    The table is built once from the weights. Each draw then picks a column
+    uniformly and keeps it or takes its alias, so the cost doesn't depend on
+    how many choices there are.
+    """
+
+    def __init__(self, weights):
+        """Build the alias table.
+
+        Args:
+            weights: Non-negative weights, at least one of them positive
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        total = weights.sum()
+        if len(weights) == 0 or total <= 0:
+            raise ValueError("AliasSampler needs at least one positive weight")
+
+        count = len(weights)
+        scaled = weights * (count / total)
+        self.prob = np.ones(count)
+        self.alias = np.arange(count)
+
+        small = [i for i in range(count) if scaled[i] < 1.0]
+        large = [i for i in range(count) if scaled[i] >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Whatever is left over is 1 up to rounding error and keeps prob 1
+
+    def __len__(self):
+        return len(self.prob)
+
+    def sample(self, uniforms):
+        """Map uniform draws in [0, 1) to choice indices.
+
+        Each draw picks the column from its integer part after scaling and
+        compares the fractional part against the column's probability, so a
+        single random number makes a whole choice.
+
+        Args:
+            uniforms: Array of floats in [0, 1)
+
+        Returns:
+            Array of indices into the weights
+        """
+        scaled = np.asarray(uniforms) * len(self.prob)
+        columns = scaled.astype(np.int64)
+        keep = (scaled - columns) < self.prob[columns]
+        return np.where(keep, columns, self.alias[columns])
@@ -0,0 +1,259 @@
+import argparse
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+import numpy as np
+from batch_sim import BatchSimulator
+from bots import BOT_NAMES, make_bot
+from event_runner import EventRunner
+from headless import HeadlessRunner, InputScript
+from constants import *
+
+# Percentiles reported for each recipe's score distribution
+REPORT_PERCENTILES = [5, 25, 50, 75, 95]
+
+
+def parse_seed_range(text):
+    """Parse a "start:stop" seed range (stop exclusive) or a single count."""
+    if ":" in text:
+        start, stop = text.split(":", 1)
+        return int(start), int(stop)
+    return 0, int(text)
+
+
+def run_chunk(task):
+    """Play one chunk of seeds for a recipe. Runs in a worker process.
+
+    Args:
+        task: (recipe_path, bot_name, engine, num_tentacles, seed_start,
+            seed_stop) tuple
+
+    Returns:
+        Dictionary with the chunk key, per-seed scores, requirement hit
+        counts and the number of rounds lost to inedible ingredients
+    """
+    recipe_path, bot_name, engine, num_tentacles, seed_start, seed_stop = task
+    seeds = range(seed_start, seed_stop)
+    bot = make_bot(bot_name, num_tentacles)
+
+    if engine in ("batch", "events") and not isinstance(bot, InputScript):
+        raise ValueError(f"Bot '{bot_name}' can't run on the {engine} engine")
+
+    if engine == "batch":
+        simulator = BatchSimulator(recipe_path, seeds, bot, num_tentacles=num_tentacles)
+        summaries = simulator.run()
+        losses = [bool(lost) for lost in simulator.inedible_losses]
+    else:
+        runner_class = EventRunner if engine == "events" else HeadlessRunner
+        summaries = []
+        losses = []
+        for seed in seeds:
+            runner = runner_class(
+                recipe_path, bot, seed=seed, num_tentacles=num_tentacles
+            )
+            summaries.append(runner.run())
+            losses.append(not runner.minigame.is_active)
+
+    requirement_hits = {}
+    for summary in summaries:
+        for ing_type, data in summary["requirements_met"].items():
+            requirement_hits[ing_type] = requirement_hits.get(ing_type, 0) + int(
+                data["met"]
+            )
+
+    return {
+        "recipe": recipe_path,
+        "bot": bot_name,
+        "tentacles": num_tentacles,
+        "start": seed_start,
+        "stop": seed_stop,
+        "scores": [summary["score"] for summary in summaries],
+        "requirement_hits": requirement_hits,
+        "inedible_losses": sum(losses),
+    }
+
+
+def chunk_key(recipe_path, bot_name, num_tentacles, seed_start, seed_stop):
+    """Identify a chunk in the checkpoint file."""
+    return (recipe_path, bot_name, num_tentacles, seed_start, seed_stop)
+
+
+def load_checkpoint(path):
+    """Read completed chunks from a checkpoint file.
+
+    A partially written last line (from an interrupted run) is ignored and
+    cut off the file, so results appended on resume start on a line of
+    their own.
+    """
+    results = []
+    if not path or not os.path.exists(path):
+        return results
+    end = 0  # Byte offset just past the last complete line
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            end += len(line)
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # Damaged line, that chunk is simply run again
+    if end < os.path.getsize(path):
+        os.truncate(path, end)
+    return results
+
+
+class BalanceStats:
+    """Accumulates chunk results for one recipe."""
+
+    def __init__(self, recipe_path):
+        self.recipe_path = recipe_path
+        self.scores = []
+        self.requirement_hits = {}
+        self.inedible_losses = 0
+
+    def add(self, result):
+        """Fold one chunk result into the totals."""
+        self.scores.extend(result["scores"])
+        for ing_type, hits in result["requirement_hits"].items():
+            self.requirement_hits[ing_type] = (
+                self.requirement_hits.get(ing_type, 0) + hits
+            )
+        self.inedible_losses += result["inedible_losses"]
+
+    def report(self):
+        """Summarise the score distribution.
+
+        Returns:
+            dict with rounds, mean, percentiles, requirement hit rates and
+            the inedible-loss rate
+        """
+        rounds = len(self.scores)
+        if rounds == 0:
+            return {"recipe": self.recipe_path, "rounds": 0}
+        scores = np.array(self.scores)
+        return {
+            "recipe": self.recipe_path,
+            "rounds": rounds,
+            "mean": float(scores.mean()),
+            "percentiles": {
+                f"p{p}": float(np.percentile(scores, p)) for p in REPORT_PERCENTILES
+            },
+            "requirement_hit_rates": {
+                ing_type: hits / rounds
+                for ing_type, hits in self.requirement_hits.items()
+            },
+            "inedible_loss_rate": self.inedible_losses / rounds,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo balance runs for filling recipes"
+    )
+    parser.add_argument("recipes", nargs="+", help="Recipe JSON files")
+    parser.add_argument("--bot", choices=BOT_NAMES, default="spread")
+    parser.add_argument(
+        "--seeds", default="0:1000", help="Seed range start:stop, or a count"
+    )
+    parser.add_argument(
+        "--engine", choices=["scalar", "batch", "events"], default="scalar"
+    )
+    parser.add_argument("--tentacles", type=int, default=NUM_TENTACLES)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument(
+        "--checkpoint", help="JSONL file of finished chunks, resumed if present"
+    )
+    parser.add_argument("--output", help="Write the final report as JSON here")
+    args = parser.parse_args()
+
+    seed_start, seed_stop = parse_seed_range(args.seeds)
+    stats = {recipe: BalanceStats(recipe) for recipe in args.recipes}
+
+    # Resume from chunks finished by an earlier run
+    done = set()
+    for result in load_checkpoint(args.checkpoint):
+        tentacles = result.get("tentacles", NUM_TENTACLES)
+        if (
+            result["recipe"] in stats
+            and result["bot"] == args.bot
+            and tentacles == args.tentacles
+        ):
+            key = chunk_key(
+                result["recipe"],
+                result["bot"],
+                tentacles,
+                result["start"],
+                result["stop"],
+            )
+            if key not in done:
+                done.add(key)
+                stats[result["recipe"]].add(result)
+    if done:
+        print(f"Resuming: {len(done)} chunks already in {args.checkpoint}")
+
+    tasks = []
+    for recipe in args.recipes:
+        for start in range(seed_start, seed_stop, args.chunk_size):
+            stop = min(start + args.chunk_size, seed_stop)
+            key = chunk_key(recipe, args.bot, args.tentacles, start, stop)
+            if key not in done:
+                tasks.append(
+                    (recipe, args.bot, args.engine, args.tentacles, start, stop)
+                )
+
+    checkpoint = open(args.checkpoint, "a") if args.checkpoint else None
+    began = time.perf_counter()
+    try:
+        with Pool(args.workers) as pool:
+            for finished, result in enumerate(
+                pool.imap_unordered(run_chunk, tasks), start=1
+            ):
+                if checkpoint:
+                    checkpoint.write(json.dumps(result) + "\n")
+                    checkpoint.flush()
+                    os.fsync(checkpoint.fileno())
+
+                recipe_stats = stats[result["recipe"]]
+                recipe_stats.add(result)
+                scores = recipe_stats.scores
+                print(
+                    f"[{finished}/{len(tasks)}] {result['recipe']} "
+                    f"seeds {result['start']}-{result['stop'] - 1}: "
+                    f"n={len(scores)} mean={np.mean(scores):.1f} "
+                    f"p50={np.percentile(scores, 50):.0f}",
+                    flush=True,
+                )
+    except KeyboardInterrupt:
+        print("\nInterrupted, rerun with the same --checkpoint to resume")
+        sys.exit(1)
+    finally:
+        if checkpoint:
+            checkpoint.close()
+
+    elapsed = time.perf_counter() - began
+    reports = [stats[recipe].report() for recipe in args.recipes]
+    for report in reports:
+        print(f"\n{report['recipe']} ({report['rounds']} rounds, bot {args.bot})")
+        if report["rounds"] == 0:
+            continue
+        print(f"  Mean score: {report['mean']:.2f}")
+        print(
+            "  Percentiles: "
+            + ", ".join(f"{k}={v:.0f}" for k, v in report["percentiles"].items())
+        )
+        for ing_type, rate in report["requirement_hit_rates"].items():
+            print(f"  {ing_type} requirement met: {rate:.1%}")
+        print(f"  Inedible loss rate: {report['inedible_loss_rate']:.1%}")
+    print(f"\nFinished {len(tasks)} chunks in {elapsed:.1f}s")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(reports, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+import math
+import numpy as np
+import pygame
+from headless import HEADLESS_DT, HEADLESS_TIME_SLACK
+from ingredient_spawner import IngredientSpawner
+from octopus import Octopus
+from recipe import load_recipe
+from score_tracker import ScoreTracker
+from tentacle import TentacleGroup, tentacle_for_key
+from constants import *
+
+# Ingredient slot states
+_UNSPAWNED = 0
+_FALLING = 1
+_GRABBED = 2
+_IN_CRUST = 3
+_MISSED = 4
+
+# Tip-to-ingredient distance at which a tentacle grabs (Tentacle.collides_with)
+_GRAB_DISTANCE = TENTACLE_TIP_RADIUS + INGREDIENT_RADIUS
+
+
+class BatchSimulator:
+    """Simulates many filling rounds in lockstep with NumPy arrays.
+
+    Every round shares the same recipe and input script and differs only by
+    its spawn seed. Positions, targets and states of all tentacles and
+    ingredients live in (rounds, ...) arrays and each frame is advanced with
+    vector operations that mirror MinigameFilling.update step for step, so
+    results match HeadlessRunner for the same seeds.
+
+    Closed-loop policies that react to game state can't be broadcast across
+    rounds; use HeadlessRunner for those.
+    """
+
+    def __init__(
+        self,
+        recipe_path,
+        seeds,
+        script=None,
+        dt=HEADLESS_DT,
+        start_immediately=True,
+        max_frames=None,
+        num_tentacles=NUM_TENTACLES,
+    ):
+        """Set up a batch of rounds.
+
+        Args:
+            recipe_path: Path to the recipe JSON file
+            seeds: Sequence of spawn seeds, one per round
+            script: InputScript shared by every round, or None for no input
+            dt: Seconds simulated per frame
+            start_immediately: Press SPACE before the first frame
+            max_frames: Frame limit, defaults to the round length plus slack
+            num_tentacles: Number of arms the octopus has
+        """
+        self.recipe_path = recipe_path
+        self.recipe = load_recipe(recipe_path)
+        self.seeds = list(seeds)
+        self.script = script
+        self.dt = dt
+        self.start_immediately = start_immediately
+        self.max_frames = max_frames
+        self.num_tentacles = num_tentacles
+
+        self.ingredient_types = self.recipe.ingredient_types
+        self.points = np.array(self.recipe.points_table, dtype=np.int64)
+        self.inedible = np.array(
+            [category == "inedible" for category in self.recipe.category_table]
+        )
+
+        self.frames = 0
+        self.inedible_losses = None
+
+    def _spawn_frames(self, total_frames):
+        """Find the frames on which ingredients spawn.
+
+        Spawn timing depends only on the phase clock, which is driven by the
+        shared script, so every round spawns on the same frames.
+        """
+        key_frames = {}
+        if self.script is not None:
+            for frame, kind, value in self.script.events:
+                if kind == "key" and value == pygame.K_SPACE:
+                    key_frames.setdefault(frame, True)
+
+        instructions = not self.start_immediately
+        prep = self.start_immediately
+        prep_remaining = PREP_PHASE_DURATION
+        elapsed = 0
+        spawn_timer = 0
+        spawn_interval = INGREDIENT_SPAWN_INTERVAL
+        spawn_frames = []
+        for frame in range(total_frames):
+            if instructions and frame in key_frames:
+                instructions = False
+                prep = True
+            if instructions:
+                continue
+            if prep:
+                prep_remaining -= self.dt
+                if prep_remaining <= 0:
+                    prep = False
+            if not prep:
+                elapsed += self.dt
+                spawn_timer += self.dt
+                if spawn_timer >= spawn_interval:
+                    spawn_timer = 0
+                    spawn_frames.append(frame)
+                if elapsed >= self.recipe.duration:
+                    break
+        return spawn_frames
+
+    def _spawn_table(self, num_slots):
+        """Take each round's spawns from its spawner's pre-generated schedule.
+
+        Returns:
+            (types, xs, counts) where counts holds how many of its slots
+            each round really spawns into; a recipe with nothing to spawn
+            has none
+        """
+        types = np.zeros((len(self.seeds), num_slots), dtype=np.int64)
+        xs = np.zeros((len(self.seeds), num_slots), dtype=np.float64)
+        counts = np.zeros(len(self.seeds), dtype=np.int64)
+        for round_index, seed in enumerate(self.seeds):
+            spawner = IngredientSpawner(self.recipe, seed)
+            schedule = spawner.schedule(self.recipe.duration, self.dt)
+            count = min(num_slots, len(schedule))
+            types[round_index, :count] = schedule.types[:count]
+            xs[round_index, :count] = schedule.xs[:count]
+            counts[round_index] = count
+        return types, xs, counts
+
+    def run(self):
+        """Simulate every round to completion.
+
+        Returns:
+            List of get_summary()-equivalent dictionaries, one per seed
+        """
+        n = len(self.seeds)
+        rounds = np.arange(n)
+        recipe = self.recipe
+
+        max_frames = self.max_frames
+        if max_frames is None:
+            round_time = recipe.duration + PREP_PHASE_DURATION
+            max_frames = math.ceil((round_time + HEADLESS_TIME_SLACK) / self.dt)
+
+        spawn_frames = self._spawn_frames(max_frames)
+        num_slots = max(len(spawn_frames), 1)
+        slot_for_frame = {frame: slot for slot, frame in enumerate(spawn_frames)}
+        spawn_types, spawn_xs, spawn_counts = self._spawn_table(num_slots)
+
+        # Tentacle state, starting where MinigameFilling places them
+        num_tentacles = self.num_tentacles
+        tentacles = TentacleGroup(Octopus(OCTOPUS_X, OCTOPUS_Y), num_tentacles)
+        start = np.array([tuple(tentacle.position) for tentacle in tentacles])
+        tentacle_pos = np.broadcast_to(start, (n, num_tentacles, 2)).copy()
+        tentacle_target = tentacle_pos.copy()
+        tentacle_locked = tentacle_pos.copy()
+        held = np.full((n, num_tentacles), -1, dtype=np.int64)
+        active = 0
+
+        # Ingredient state, one slot per spawn
+        ingredient_pos = np.zeros((n, num_slots, 2))
+        ingredient_state = np.full((n, num_slots), _UNSPAWNED, dtype=np.int8)
+        holder = np.full((n, num_slots), -1, dtype=np.int64)
+
+        crust_x = float(PIE_CRUST_X)
+        crust_y = float(PIE_CRUST_Y)
+        crust_left = crust_x - PIE_CRUST_WIDTH // 2
+        crust_right = crust_x + PIE_CRUST_WIDTH // 2
+        crust_top = crust_y - PIE_CRUST_HEIGHT // 2
+        crust_bottom = crust_y + PIE_CRUST_HEIGHT // 2
+
+        num_types = len(self.ingredient_types)
+        counts = np.zeros((n, num_types), dtype=np.int64)
+        lost = np.zeros(n, dtype=bool)
+        done = np.zeros(n, dtype=bool)
+        final_counts = np.zeros_like(counts)
+        final_lost = np.zeros_like(lost)
+
+        mouse = np.array([OCTOPUS_X, OCTOPUS_Y], dtype=np.float64)
+        mouse_pressed = False
+        instructions = True
+        prep = False
+        prep_remaining = PREP_PHASE_DURATION
+        elapsed = 0
+        smoothing = min(TENTACLE_SMOOTHING * self.dt, 1.0)
+        fall_step = INGREDIENT_FALL_SPEED * self.dt
+
+        events = self.script.events if self.script is not None else []
+        next_event = 0
+        if self.start_immediately:
+            instructions = False
+            prep = True
+
+        def collect(rows, slots):
+            """Move the given ingredients into the crust."""
+            ingredient_state[rows, slots] = _IN_CRUST
+            holder[rows, slots] = -1
+            collected = spawn_types[rows, slots]
+            np.add.at(counts, (rows, collected), 1)
+            lost[rows] |= self.inedible[collected]
+
+        def in_crust(rows, slots):
+            x = ingredient_pos[rows, slots, 0]
+            y = ingredient_pos[rows, slots, 1]
+            return (
+                (crust_left <= x)
+                & (x <= crust_right)
+                & (crust_top <= y)
+                & (y <= crust_bottom)
+            )
+
+        def first_grab(index, candidates):
+            """Find the first falling ingredient each tentacle can reach."""
+            if low == high:
+                return np.zeros(n, dtype=bool), np.zeros(n, dtype=np.int64)
+            delta = tentacle_pos[:, index, None, :] - ingredient_pos[:, low:high]
+            dx = delta[..., 0]
+            dy = delta[..., 1]
+            distance = np.sqrt(dx * dx + dy * dy)
+            hits = ingredient_state[:, low:high] == _FALLING
+            hits &= distance <= _GRAB_DISTANCE
+            hits &= candidates[:, None]
+            found = hits.any(axis=1)
+            return found, hits.argmax(axis=1) + low
+
+        def grab(index, found, slots):
+            rows = rounds[found]
+            slots = slots[found]
+            held[rows, index] = slots
+            holder[rows, slots] = index
+            ingredient_state[rows, slots] = _GRABBED
+
+        # Only slots in [low, high) can still be falling or held
+        low = 0
+        high = 0
+
+        self.frames = 0
+        while self.frames < max_frames and not done.all():
+            frame = self.frames
+
+            # Scripted input shared by every round
+            while next_event < len(events) and events[next_event][0] <= frame:
+                _, kind, value = events[next_event]
+                next_event += 1
+                if kind == "motion":
+                    mouse = np.array(value, dtype=np.float64)
+                elif kind == "button":
+                    mouse_pressed = value
+                elif kind == "key":
+                    if value == pygame.K_SPACE and instructions:
+                        instructions = False
+                        prep = True
+                        continue
+                    index = tentacle_for_key(value, active, num_tentacles)
+                    if index is not None and index != active:
+                        tentacle_locked[:, active] = tentacle_pos[:, active]
+                        tentacle_target[:, active] = tentacle_locked[:, active]
+                        active = index
+
+            self.frames += 1
+            if instructions:
+                continue
+
+            if prep:
+                prep_remaining -= self.dt
+                if prep_remaining <= 0:
+                    prep = False
+            if not prep:
+                elapsed += self.dt
+
+            # Tentacles lerp toward their targets
+            tentacle_target[:, active] = mouse
+            tentacle_pos += (tentacle_target - tentacle_pos) * smoothing
+
+            # Spawns land on the same frame in every round
+            slot = slot_for_frame.get(frame)
+            if slot is not None:
+                # Only rounds whose schedule has this spawn, like spawn()
+                # returning None when the recipe has nothing to spawn
+                spawning = spawn_counts > slot
+                ingredient_state[spawning, slot] = _FALLING
+                ingredient_pos[spawning, slot, 0] = spawn_xs[spawning, slot]
+                ingredient_pos[spawning, slot, 1] = INGREDIENT_SPAWN_Y
+                high = slot + 1
+
+            # Falling ingredients move, held ones follow their tentacle
+            window_state = ingredient_state[:, low:high]
+            window_y = ingredient_pos[:, low:high, 1]
+            falling = window_state == _FALLING
+            window_y += np.where(falling, fall_step, 0.0)
+            window_state[falling & (window_y > SCREEN_HEIGHT + INGREDIENT_RADIUS)] = (
+                _MISSED
+            )
+            grabbed_rows, grabbed_slots = np.nonzero(window_state == _GRABBED)
+            grabbed_slots += low
+            ingredient_pos[grabbed_rows, grabbed_slots] = tentacle_pos[
+                grabbed_rows, holder[grabbed_rows, grabbed_slots]
+            ]
+
+            # Active tentacle grabs or releases with the mouse button
+            active_held = held[:, active]
+            if mouse_pressed:
+                found, slots = first_grab(active, active_held < 0)
+                grab(active, found, slots)
+            else:
+                releasing = active_held >= 0
+                rows = rounds[releasing]
+                slots = active_held[releasing]
+                held[rows, active] = -1
+                landed = in_crust(rows, slots)
+                collect(rows[landed], slots[landed])
+                ingredient_state[rows[~landed], slots[~landed]] = _FALLING
+                holder[rows[~landed], slots[~landed]] = -1
+
+            # Inactive tentacles auto-grab and carry to the crust, in order
+            for index in range(num_tentacles):
+                if index == active:
+                    continue
+                carrying = held[:, index] >= 0
+                found, slots = first_grab(index, ~carrying)
+                grab(index, found, slots)
+
+                rows = rounds[carrying]
+                slots = held[rows, index]
+                tentacle_target[rows, index] = (crust_x, crust_y)
+                landed = in_crust(rows, slots)
+                rows = rows[landed]
+                held[rows, index] = -1
+                collect(rows, slots[landed])
+                tentacle_target[rows, index] = tentacle_locked[rows, index]
+
+            # Retire slots that are settled in every round
+            while (
+                low < high
+                and not (
+                    (ingredient_state[:, low] == _FALLING)
+                    | (ingredient_state[:, low] == _GRABBED)
+                ).any()
+            ):
+                low += 1
+
+            # Record results for rounds that finished this frame
+            finished = ~done & (lost | (elapsed >= recipe.duration))
+            final_counts[finished] = counts[finished]
+            final_lost[finished] = lost[finished]
+            done |= finished
+
+        # Rounds cut off by max_frames report where they stopped
+        final_counts[~done] = counts[~done]
+        final_lost[~done] = lost[~done]
+        self.inedible_losses = final_lost
+        return [self._summary(final_counts[i]) for i in range(n)]
+
+    def _summary(self, type_counts):
+        """Build a get_summary()-shaped dictionary from per-type counts."""
+        tracker = ScoreTracker(self.recipe)
+        for ing_type, points, count in zip(
+            self.ingredient_types, self.points.tolist(), type_counts.tolist()
+        ):
+            if count > 0:
+                tracker.add_type(ing_type, points, count)
+
+        return {
+            "score": tracker.get_score(),
+            "recipe_name": self.recipe.name,
+            "ingredients_collected": dict(tracker.counts),
+            "requirements_met": tracker.get_requirements(),
+            "total_ingredients": tracker.total,
+        }
@@ -0,0 +1,327 @@
+import argparse
+import fnmatch
+import gc
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+
+# Benchmarks never open a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from bots import make_bot
+from dirty_renderer import DirtyRectRenderer
+from display_setup import open_display
+from minigame_filling import MinigameFilling
+from constants import *
+
+BENCHMARK_RECIPE = "recipes/apple_pie.json"
+BENCHMARK_SEED = 0
+
+# Stress runs cover every combination of these
+STRESS_INGREDIENTS = [100, 1000, 10000]
+STRESS_TENTACLES = [4, 16, 64]
+
+# Measured frames per scenario (the typical round always plays in full) and
+# unmeasured frames run first to warm caches
+DEFAULT_FRAMES = 120
+WARMUP_FRAMES = 10
+
+# Crust size for the score calculation scenario
+SCORE_INGREDIENTS = 1000
+
+# Allowed slowdown of a median against the baseline before it's flagged,
+# ignoring differences too small to tell apart from timer noise
+DEFAULT_THRESHOLD = 0.2
+MIN_REGRESSION_MS = 0.05
+
+# Highest spawn point of stress ingredients, low enough that none fall off
+# screen during a run
+STRESS_MAX_Y = 400
+
+
+def new_round(num_tentacles=NUM_TENTACLES):
+    """Start a seeded round past the instructions screen."""
+    minigame = MinigameFilling(BENCHMARK_RECIPE, BENCHMARK_SEED, num_tentacles)
+    minigame.start()
+    minigame.handle_key_press(pygame.K_SPACE)
+    return minigame
+
+
+def setup_idle():
+    """Prep phase with the arms at rest and nothing falling."""
+    return new_round(), None
+
+
+def setup_typical():
+    """A full apple pie round played by the spread bot."""
+    return new_round(), make_bot("spread")
+
+
+def stress_setup(num_ingredients, num_tentacles):
+    """Make a setup with many ingredients falling across the screen."""
+
+    def setup():
+        minigame = new_round(num_tentacles)
+        # Skip the prep phase and stop spawning so the count stays fixed
+        minigame.prep_time_remaining = 0
+        minigame.spawner.spawn_interval = math.inf
+
+        rng = random.Random(BENCHMARK_SEED)
+        for _ in range(num_ingredients):
+            ingredient = minigame.spawner.spawn()
+            ingredient.position.update(
+                rng.uniform(INGREDIENT_RADIUS, SCREEN_WIDTH - INGREDIENT_RADIUS),
+                rng.uniform(0, STRESS_MAX_Y),
+            )
+            ingredient.store_previous_position()
+            minigame.add_ingredient(ingredient)
+        minigame.handle_mouse_motion((OCTOPUS_X, OCTOPUS_Y - 100))
+        minigame.handle_mouse_button(True)
+        return minigame, None
+
+    return setup
+
+
+class Scenario:
+    """A repeatable game situation to time."""
+
+    def __init__(self, name, setup, frames=None):
+        """Describe a scenario.
+
+        Args:
+            name: Name used in results and --only patterns
+            setup: Function returning (minigame, policy); policy is applied
+                before every update and may be None
+            frames: Frames to measure, or None for the --frames setting
+        """
+        self.name = name
+        self.setup = setup
+        self.frames = frames
+
+
+def build_scenarios():
+    """All gameplay scenarios in the order they run."""
+    round_frames = math.ceil((PREP_PHASE_DURATION + MINIGAME_DURATION) / FIXED_DT)
+    scenarios = [
+        Scenario("idle", setup_idle),
+        Scenario("typical", setup_typical, round_frames),
+    ]
+    for num_ingredients in STRESS_INGREDIENTS:
+        for num_tentacles in STRESS_TENTACLES:
+            scenarios.append(
+                Scenario(
+                    f"stress-{num_ingredients}x{num_tentacles}",
+                    stress_setup(num_ingredients, num_tentacles),
+                )
+            )
+    return scenarios
+
+
+def summarize(samples):
+    """Reduce per-frame times in seconds to millisecond statistics."""
+    ms = np.array(samples) * 1000
+    return {
+        "mean_ms": float(ms.mean()),
+        "median_ms": float(np.median(ms)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "max_ms": float(ms.max()),
+    }
+
+
+def step(minigame, policy):
+    """Advance one fixed step, as the main loop does."""
+    if policy is not None:
+        policy.apply(minigame, minigame.frame)
+    minigame.store_previous_positions()
+    minigame.update(FIXED_DT)
+
+
+def measure_update_and_draw(scenario, screen, frames):
+    """Time update and a full redraw separately on every frame."""
+    minigame, policy = scenario.setup()
+    for _ in range(WARMUP_FRAMES):
+        step(minigame, policy)
+        minigame.draw(screen)
+
+    update_times = []
+    draw_times = []
+    for _ in range(frames):
+        if policy is not None:
+            policy.apply(minigame, minigame.frame)
+        minigame.store_previous_positions()
+        began = time.perf_counter()
+        minigame.update(FIXED_DT)
+        updated = time.perf_counter()
+        minigame.draw(screen)
+        drawn = time.perf_counter()
+        update_times.append(updated - began)
+        draw_times.append(drawn - updated)
+    return update_times, draw_times
+
+
+def measure_frame(scenario, screen, frames):
+    """Time whole frames: update, dirty-rect draw and presenting."""
+    minigame, policy = scenario.setup()
+    renderer = DirtyRectRenderer()
+    for _ in range(WARMUP_FRAMES):
+        step(minigame, policy)
+        renderer.draw(screen, minigame)
+        renderer.present()
+
+    frame_times = []
+    for _ in range(frames):
+        began = time.perf_counter()
+        step(minigame, policy)
+        renderer.draw(screen, minigame)
+        renderer.present()
+        frame_times.append(time.perf_counter() - began)
+    return frame_times
+
+
+def measure_score(frames):
+    """Time Recipe.calculate_score over a full crust."""
+    minigame = new_round()
+    contents = [minigame.spawner.spawn() for _ in range(SCORE_INGREDIENTS)]
+    times = []
+    for _ in range(frames):
+        began = time.perf_counter()
+        minigame.recipe.calculate_score(contents)
+        times.append(time.perf_counter() - began)
+    return times
+
+
+def run_benchmarks(patterns, frames):
+    """Run every scenario matching one of the patterns.
+
+    Returns:
+        Dictionary of scenario name to metric name to statistics
+    """
+    pygame.init()
+    # The same window setup as the game, so surfaces are in the same format
+    screen, _ = open_display()
+
+    def selected(name):
+        return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+    results = {}
+    for scenario in build_scenarios():
+        if not selected(scenario.name):
+            continue
+        scenario_frames = scenario.frames or frames
+        gc.collect()
+        update_times, draw_times = measure_update_and_draw(
+            scenario, screen, scenario_frames
+        )
+        gc.collect()
+        frame_times = measure_frame(scenario, screen, scenario_frames)
+        results[scenario.name] = {
+            "update": summarize(update_times),
+            "draw": summarize(draw_times),
+            "frame": summarize(frame_times),
+        }
+        print_result(scenario.name, results[scenario.name])
+
+    name = f"score-{SCORE_INGREDIENTS}"
+    if selected(name):
+        gc.collect()
+        results[name] = {"call": summarize(measure_score(frames))}
+        print_result(name, results[name])
+
+    pygame.quit()
+    return results
+
+
+def print_result(name, metrics):
+    for metric, stats in metrics.items():
+        print(
+            f"{name:<20} {metric:<7} median {stats['median_ms']:8.3f} ms  "
+            f"p95 {stats['p95_ms']:8.3f} ms",
+            flush=True,
+        )
+
+
+def compare(results, baseline, threshold):
+    """Compare medians against a baseline run.
+
+    Returns:
+        List of (scenario, metric, current, baseline) tuples for the
+        measurements that got slower by more than the threshold
+    """
+    regressions = []
+    print(f"\nComparison with baseline (threshold {threshold:.0%}):")
+    for name, metrics in results.items():
+        for metric, stats in metrics.items():
+            base = baseline.get(name, {}).get(metric)
+            if base is None:
+                continue
+            current = stats["median_ms"]
+            before = base["median_ms"]
+            change = current / before - 1 if before > 0 else 0.0
+            flag = ""
+            if change > threshold and current - before > MIN_REGRESSION_MS:
+                flag = "  REGRESSION"
+                regressions.append((name, metric, current, before))
+            print(
+                f"  {name:<20} {metric:<7} {current:8.3f} ms vs "
+                f"{before:8.3f} ms ({change:+.0%}){flag}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the filling minigame's update and draw paths"
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        default=["*"],
+        metavar="PATTERN",
+        help="Run scenarios matching these patterns, e.g. 'stress-*x4'",
+    )
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--output", help="Write the results as JSON here")
+    parser.add_argument("--baseline", help="Compare against this results file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Fractional slowdown of a median that counts as a regression",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.only, args.frames)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "frames": args.frames,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} measurements regressed")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
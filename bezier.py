@@ -0,0 +1,36 @@
+import functools
+import math
+import numpy as np
+from constants import *
+
+
+@functools.lru_cache(maxsize=None)
+def bernstein_basis(segments):
+    """Quadratic Bernstein weights for evenly spaced t in [0, 1].
+
+    Returns:
+        (segments + 1, 3) array whose rows are (1-t)², 2(1-t)t and t²
+    """
+    t = np.linspace(0.0, 1.0, segments + 1)
+    basis = np.stack([(1 - t) ** 2, 2 * (1 - t) * t, t**2], axis=1)
+    basis.flags.writeable = False
+    return basis
+
+
+def segments_for_length(length):
+    """Pick how many line segments a curve of this length needs."""
+    segments = math.ceil(length / TENTACLE_SEGMENT_LENGTH)
+    return max(TENTACLE_MIN_SEGMENTS, min(TENTACLE_MAX_SEGMENTS, segments))
+
+
+def tessellate(control_points, segments):
+    """Evaluate quadratic Bezier curves that share a segment count.
+
+    Args:
+        control_points: (curves, 3, 2) array of start, control, end points
+        segments: Number of line segments per curve
+
+    Returns:
+        (curves, segments + 1, 2) array of points along each curve
+    """
+    return bernstein_basis(segments) @ control_points
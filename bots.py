@@ -0,0 +1,85 @@
+from headless import InputScript
+from tentacle import TENTACLE_CYCLE_KEY
+from constants import *
+
+# Frames to wait for an arm to settle before switching to the next one
+SETTLE_FRAMES = 60
+
+# Height the spread bot parks its arms at
+SPREAD_Y = 200
+
+
+def spread_script(num_tentacles=NUM_TENTACLES):
+    """Script that parks every arm at an even spot across the screen.
+
+    Each arm is selected in turn, moved to its spot and left there when the
+    next one is selected, so parked arms auto-catch anything falling past.
+    Arms are selected with TAB, which works for any number of them.
+    """
+    script = InputScript()
+    for index in range(num_tentacles):
+        x = SCREEN_WIDTH * (2 * index + 1) // (2 * num_tentacles)
+        frame = index * SETTLE_FRAMES
+        if index > 0:
+            script.add(frame, "key", TENTACLE_CYCLE_KEY)
+        script.add(frame, "motion", (x, SPREAD_Y))
+    return script
+
+
+class ChaserBot:
+    """Closed-loop bot that chases good ingredients with the active arm.
+
+    The active arm heads for the lowest falling good ingredient, holds the
+    mouse button while touching it and releases over the crust. The other
+    arms stay parked where they started.
+    """
+
+    def reset(self):
+        """Nothing to rewind between rounds."""
+        pass
+
+    def apply(self, minigame, frame):
+        """Steer the active arm for this frame."""
+        tentacle = minigame.tentacles[minigame.active_tentacle_index]
+
+        if tentacle.is_grabbing:
+            minigame.handle_mouse_motion(tuple(minigame.pie_crust.position))
+            if minigame.pie_crust.collides_with(tentacle.grabbed_object):
+                minigame.handle_mouse_button(False)
+            return
+
+        targets = [
+            ingredient
+            for ingredient in minigame.falling_ingredients
+            if ingredient.state == INGREDIENT_FALLING and ingredient.category == "good"
+        ]
+        if not targets:
+            minigame.handle_mouse_button(False)
+            return
+
+        target = max(targets, key=lambda ingredient: ingredient.position.y)
+        minigame.handle_mouse_motion(tuple(target.position))
+        minigame.handle_mouse_button(tentacle.collides_with(target))
+
+
+def make_bot(name, num_tentacles=NUM_TENTACLES):
+    """Create a bot policy by name.
+
+    Args:
+        name: One of BOT_NAMES
+        num_tentacles: Number of arms the bot will be playing with
+
+    Returns:
+        An object with reset() and apply(minigame, frame); scripted bots are
+        InputScripts and can also drive BatchSimulator
+    """
+    if name == "idle":
+        return InputScript()
+    if name == "spread":
+        return spread_script(num_tentacles)
+    if name == "chaser":
+        return ChaserBot()
+    raise ValueError(f"Unknown bot: {name}")
+
+
+BOT_NAMES = ["idle", "spread", "chaser"]
@@ -13,6 +13,7 @@ COLOR_APPLE = (200, 50, 50)  # Red apple
 COLOR_BERRY = (100, 50, 150)  # Purple berry
 COLOR_CINNAMON = (139, 69, 19)  # Brown cinnamon
 COLOR_ROCK = (100, 100, 100)  # Gray rock
+INGREDIENT_COLORKEY = (255, 0, 255)  # Transparent corners of ingredient sprites
 COLOR_UI_TEXT = (50, 50, 50)  # Dark gray text
 COLOR_TIMER = (255, 100, 100)  # Red timer
 COLOR_SCORE = (50, 200, 50)  # Green score
@@ -23,14 +24,23 @@ OCTOPUS_Y = SCREEN_HEIGHT // 2  # Center vertically
 OCTOPUS_RADIUS = 40
 
 # Tentacle settings
-NUM_TENTACLES = 4  # Number of controllable tentacles
+NUM_TENTACLES = 4  # Default number of controllable tentacles
 TENTACLE_TIP_RADIUS = 15
 TENTACLE_SMOOTHING = 8.0  # Lower = faster, higher = smoother
 TENTACLE_GRAB_HIGHLIGHT = (255, 200, 220)  # Color when grabbing
 TENTACLE_INACTIVE_COLOR = (200, 100, 140)  # Dimmed color for inactive tentacles
-# Starting angles for tentacles (in degrees, clockwise from top)
-TENTACLE_ANGLES = [45, 90, 135, 180]  # Top-right, Right, Bottom-right, Bottom
+# Starting angles for tentacles (in degrees, clockwise from top). With four
+# arms they sit top-right, right, bottom-right and bottom; more arms are
+# packed closer together to fit around the octopus.
+TENTACLE_FIRST_ANGLE = 45
+TENTACLE_ANGLE_STEP = 45
 TENTACLE_OFFSET = 80  # Initial distance from octopus center
+TENTACLE_CURVE_BEND = 0.2  # Curve control point offset, as a fraction of length
+TENTACLE_MIN_SEGMENTS = 4  # Line segments used for the shortest arms
+TENTACLE_MAX_SEGMENTS = 20  # Line segments used for long arms
+TENTACLE_SEGMENT_LENGTH = 12  # Approximate pixels of arm per line segment
+TENTACLE_CURVE_TOLERANCE = 0.5  # Tip movement (px) before the curve is rebuilt
+TENTACLE_BATCH_MIN = 8  # Arms needed before smoothing runs on NumPy arrays
 
 # Pie crust settings
 PIE_CRUST_X = SCREEN_WIDTH // 2  # Center horizontally
@@ -43,6 +53,11 @@ INGREDIENT_RADIUS = 20
 INGREDIENT_FALL_SPEED = 150  # Pixels per second
 INGREDIENT_SPAWN_Y = -INGREDIENT_RADIUS  # Spawn above screen
 INGREDIENT_SPAWN_INTERVAL = 1.5  # Seconds between spawns
+# Ingredient states
+INGREDIENT_FALLING = 0
+INGREDIENT_GRABBED = 1
+INGREDIENT_IN_CRUST = 2
+INGREDIENT_MISSED = 3
 
 # Minigame settings
 MINIGAME_DURATION = 20  # Seconds
@@ -51,8 +66,19 @@ PREP_PHASE_DURATION = 5  # Seconds to position tentacles before ingredients spaw
 
 # Physics
 GRAVITY = 0  # Not using gravity, constant fall speed
+FIXED_DT = 1 / 60  # Seconds per simulation step
+MAX_FRAME_TIME = 0.25  # Longest frame fed to the simulation, to ride out hitches
+
+# Rendering
+DIRTY_FULL_UPDATE_RATIO = 0.5  # Flip the whole screen above this dirty fraction
+
+# Profiling
+PROFILER_HISTORY = 600  # Frames kept for rolling percentiles (10s at 60 FPS)
+PROFILER_HUD_REFRESH = 30  # Frames between redraws of the timing HUD
+PROFILER_HUD_FONT_SIZE = 20
 
 # UI settings
 UI_MARGIN = 20
 UI_FONT_SIZE = 32
 UI_SMALL_FONT_SIZE = 24
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept by text_cache
@@ -0,0 +1,71 @@
+import pygame
+from frame_profiler import frame_profiler
+from constants import *
+
+
+class DirtyRectRenderer:
+    """Redraws and presents only the parts of the screen that changed.
+
+    The minigame's static background comes from its cached layer. Each
+    frame the areas drawn last frame are restored from that layer, the
+    moving parts are drawn on top, and only the old and new areas are sent
+    to the display. When most of the screen is dirty a full flip is cheaper.
+    """
+
+    def __init__(self, full_update_ratio=DIRTY_FULL_UPDATE_RATIO):
+        """Create a renderer.
+
+        Args:
+            full_update_ratio: Fraction of the screen above which the whole
+                display is flipped instead of updating individual rects
+        """
+        self.full_update_ratio = full_update_ratio
+        self.background = None
+        self.minigame = None
+        self.previous_rects = []
+        self.frame_rects = []
+        self.full_update = True
+
+    def invalidate(self):
+        """Redraw the whole background and flip on the next frame."""
+        self.background = None
+
+    def draw(self, screen, minigame, alpha=1.0):
+        """Restore last frame's dirty areas and draw the minigame's moving parts.
+
+        Args:
+            screen: Display surface
+            minigame: Minigame with get_background and draw_dynamic methods
+            alpha: Interpolation between the last two simulation steps
+        """
+        background = minigame.get_background(screen.get_size())
+        if self.background is not background or self.minigame is not minigame:
+            self.background = background
+            self.minigame = minigame
+            screen.blit(self.background, (0, 0))
+            self.full_update = True
+        else:
+            for rect in self.previous_rects:
+                screen.blit(self.background, rect, rect)
+        frame_profiler.mark("background")
+
+        self.frame_rects = minigame.draw_dynamic(screen, alpha)
+
+    def add_rect(self, rect):
+        """Mark an extra area drawn this frame, such as an overlay."""
+        self.frame_rects.append(rect)
+
+    def present(self):
+        """Push this frame's changes to the display."""
+        dirty = self.previous_rects + self.frame_rects
+        screen_area = self.background.get_width() * self.background.get_height()
+        dirty_area = sum(rect.width * rect.height for rect in dirty)
+
+        if self.full_update or dirty_area > screen_area * self.full_update_ratio:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
+
+        self.previous_rects = self.frame_rects
+        self.frame_rects = []
+        self.full_update = False
@@ -0,0 +1,115 @@
+import warnings
+import pygame
+from collections import namedtuple
+from constants import *
+
+# Flags asked for on every window. pygame 2 only honours them for fullscreen
+# and OpenGL windows and ignores them elsewhere.
+DISPLAY_BASE_FLAGS = pygame.HWSURFACE | pygame.DOUBLEBUF
+
+# Flag names for the startup report, in the order they're listed
+DISPLAY_FLAG_NAMES = [
+    (pygame.HWSURFACE, "HWSURFACE"),
+    (pygame.DOUBLEBUF, "DOUBLEBUF"),
+    (pygame.FULLSCREEN, "FULLSCREEN"),
+    (pygame.OPENGL, "OPENGL"),
+    (pygame.SCALED, "SCALED"),
+    (pygame.RESIZABLE, "RESIZABLE"),
+    (pygame.NOFRAME, "NOFRAME"),
+    (pygame.PREALLOC, "PREALLOC"),
+]
+
+# What open_display ended up with. size is the logical resolution the game
+# draws at and window_size what it's shown at on the desktop. flags are the
+# display surface's flags as SDL set them, requested_flags what was asked for.
+DisplayConfig = namedtuple(
+    "DisplayConfig",
+    ["driver", "size", "window_size", "bits", "flags", "requested_flags", "vsync"],
+)
+
+
+def open_display(scaled=False):
+    """Create the game window with the best flags the platform allows.
+
+    Open the display before building anything that gets drawn: cached
+    surfaces are converted to the pixel format of the display that exists
+    when they're made.
+
+    Args:
+        scaled: Keep the SCREEN_WIDTH x SCREEN_HEIGHT logical resolution
+            and let SDL scale it to fit the desktop. Scaled windows are drawn
+            through an SDL renderer, which is also what makes vsync
+            available.
+
+    Returns:
+        (screen, config) with the display surface and a DisplayConfig
+    """
+    size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    flags = DISPLAY_BASE_FLAGS
+    if scaled:
+        flags |= pygame.SCALED
+
+    screen = None
+    vsync = False
+    if scaled:
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                screen = pygame.display.set_mode(size, flags, vsync=1)
+            # Without an accelerated renderer pygame warns and falls back to
+            # a software one, which can't wait for vsync
+            vsync = not any("renderer" in str(w.message) for w in caught)
+        except pygame.error:
+            pass  # No vsync on this renderer, fall back to the clock alone
+    if screen is None:
+        screen = pygame.display.set_mode(size, flags)
+
+    config = DisplayConfig(
+        pygame.display.get_driver(),
+        screen.get_size(),
+        pygame.display.get_window_size(),
+        screen.get_bitsize(),
+        screen.get_flags(),
+        flags,
+        vsync,
+    )
+    return screen, config
+
+
+def describe_display(config):
+    """Summarize a DisplayConfig in one line for the startup report."""
+    width, height = config.size
+    window_width, window_height = config.window_size
+    return (
+        f"{config.driver} driver, {width}x{height} logical in a "
+        f"{window_width}x{window_height} window, {config.bits}-bit, "
+        f"flags {flag_names(config.flags)} "
+        f"(requested {flag_names(config.requested_flags)}), "
+        f"vsync {'on' if config.vsync else 'off'}"
+    )
+
+
+def flag_names(flags):
+    """Name the display flags set in a bitmask, joined with |."""
+    names = [name for flag, name in DISPLAY_FLAG_NAMES if flags & flag]
+    return "|".join(names) or "none"
+
+
+def to_display_format(surface, alpha=False):
+    """Convert a surface to the display's pixel format so blits needn't.
+
+    Surfaces are returned as they are when no display is open, such as in
+    headless runs.
+
+    Args:
+        surface: Surface to convert
+        alpha: Keep per-pixel alpha (convert_alpha) instead of dropping it
+
+    Returns:
+        The converted surface, or surface itself without a display
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if alpha:
+        return surface.convert_alpha()
+    return surface.convert()
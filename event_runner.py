@@ -0,0 +1,171 @@
+import math
+from headless import HeadlessRunner, InputScript
+from constants import *
+
+
+class EventRunner(HeadlessRunner):
+    """HeadlessRunner that jumps over frames where nothing can happen.
+
+    Most frames of a scripted round only move things along: timers tick,
+    ingredients fall and the selected arm eases toward the mouse. Before
+    each update the runner works out how many frames pass before the next
+    one that can change the round: the next scripted input, the end of the
+    prep phase, the next spawn, an ingredient leaving the screen, a parked
+    arm's predicted intercept or the end of the round. Frames up to that
+    point are covered in one jump and the event frame runs through the
+    normal update.
+
+    Jumps repeat the per-frame floating point sums (timers, arm smoothing
+    and fall steps that aren't exact) so rounds play out exactly as under
+    HeadlessRunner, frame for frame. Only InputScript policies are
+    supported, since a closed-loop bot has to see every frame.
+    """
+
+    def __init__(self, recipe_path, policy=None, **kwargs):
+        """Set up an event-driven round.
+
+        Args:
+            recipe_path: Path to the recipe JSON file
+            policy: InputScript driving the round, or None for no input
+            **kwargs: Other HeadlessRunner options
+        """
+        if policy is not None and not isinstance(policy, InputScript):
+            raise ValueError("EventRunner can only play InputScript policies")
+        super().__init__(recipe_path, policy, **kwargs)
+        self.updates = 0  # Frames run through MinigameFilling.update
+
+    def run(self):
+        """Play one round to completion.
+
+        Returns:
+            The minigame's get_summary() dictionary
+        """
+        self.updates = 0
+        return super().run()
+
+    def _advance(self, max_frames):
+        """Jump over the quiet frames ahead, or run the next update."""
+        quiet = self._quiet_frames(max_frames)
+        if quiet > 0:
+            self._skip(quiet)
+            self.frames += quiet
+            return True
+        self.updates += 1
+        return super()._advance(max_frames)
+
+    def _quiet_frames(self, max_frames):
+        """Count the upcoming updates that would only move things along.
+
+        Returns:
+            Number of updates before the next one that can change the
+            round, 0 if the next one can
+        """
+        minigame = self.minigame
+        limit = max_frames - self.frames
+        next_input = self.policy.next_frame() if self.policy is not None else None
+        if next_input is not None:
+            limit = min(limit, next_input - self.frames)
+
+        # Nothing but the frame count changes until SPACE is pressed
+        if minigame.instructions_phase:
+            return limit
+
+        # A held button with nothing grabbed tries to grab every frame, and
+        # a released one with something grabbed drops it
+        active = minigame.tentacles[minigame.active_tentacle_index]
+        if minigame.mouse_pressed != active.is_grabbing:
+            return 0
+
+        # Every idle arm has to be parked with no intercept coming up
+        intercepts = minigame.intercepts
+        if intercepts.new_falling or intercepts.dt != self.dt:
+            return 0
+        for tentacle in minigame.tentacles:
+            if tentacle.is_active:
+                continue
+            if tentacle.is_grabbing or tentacle not in intercepts.parked:
+                return 0
+        frame = minigame.frame
+        if max(intercepts.awake_until.values(), default=-1) > frame:
+            return 0
+        if intercepts.heap:
+            limit = min(limit, intercepts.heap[0][0] - frame - 1)
+
+        # Leaving the screen, kept a frame clear of rounding
+        step = INGREDIENT_FALL_SPEED * self.dt
+        for ingredient in minigame.falling_ingredients:
+            if ingredient.state == INGREDIENT_FALLING:
+                bottom = SCREEN_HEIGHT + ingredient.radius - ingredient.position.y
+                limit = min(limit, math.floor(bottom / step) - 1)
+        if limit <= 0:
+            return 0
+
+        # Replay the timers to find the frame prep ends, something spawns or
+        # the round runs out
+        dt = self.dt
+        if minigame.prep_phase:
+            remaining = minigame.prep_time_remaining
+            for quiet in range(limit):
+                remaining -= dt
+                if remaining <= 0:
+                    return quiet
+            return limit
+
+        elapsed = minigame.elapsed_time
+        spawn_timer = minigame.spawner.spawn_timer
+        spawn_interval = minigame.spawner.spawn_interval
+        for quiet in range(limit):
+            elapsed += dt
+            spawn_timer += dt
+            if spawn_timer >= spawn_interval or elapsed >= minigame.duration:
+                return quiet
+        return limit
+
+    def _skip(self, frames):
+        """Apply the effect of a number of quiet updates at once."""
+        minigame = self.minigame
+        dt = self.dt
+        minigame.frame += frames
+        if minigame.instructions_phase:
+            return
+
+        # Timers, summed frame by frame like update() does
+        if minigame.prep_phase:
+            remaining = minigame.prep_time_remaining
+            for _ in range(frames):
+                remaining -= dt
+            minigame.prep_time_remaining = remaining
+        else:
+            elapsed = minigame.elapsed_time
+            spawn_timer = minigame.spawner.spawn_timer
+            for _ in range(frames):
+                elapsed += dt
+                spawn_timer += dt
+            minigame.elapsed_time = elapsed
+            minigame.spawner.spawn_timer = spawn_timer
+
+        # Only the selected arm can be moving; parked arms stay put
+        active = minigame.tentacles[minigame.active_tentacle_index]
+        active.set_target(minigame.mouse_pos)
+        for _ in range(frames):
+            x, y = active.position
+            active.update(dt)
+            if active.position.x == x and active.position.y == y:
+                break
+
+        # Steps of a multiple of half a pixel from a multiple of half a pixel
+        # add up without rounding, so those falls are done in one go
+        step = INGREDIENT_FALL_SPEED * dt
+        exact = (2 * step).is_integer()
+        for ingredient in minigame.falling_ingredients:
+            if ingredient.state == INGREDIENT_FALLING:
+                y = ingredient.position.y
+                if exact and (2 * y).is_integer():
+                    y += frames * step
+                else:
+                    for _ in range(frames):
+                        y += step
+                ingredient.position.y = y
+            else:
+                ingredient.update(dt)
+            minigame.ingredient_grid.move(ingredient)
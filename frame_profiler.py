@@ -0,0 +1,160 @@
+import json
+import time
+import numpy as np
+import pygame
+from display_setup import to_display_format
+from text_cache import get_font
+from constants import *
+
+# Frame phases in the order the main loop runs them. The crust and octopus
+# are baked into the static background layer, so restoring it is timed as
+# one "background" phase.
+PROFILER_PHASES = (
+    "events",
+    "update",
+    "background",
+    "tentacles",
+    "ingredients",
+    "ui",
+    "flip",
+    "tick",
+)
+
+# Percentiles shown in the HUD and returned by FrameProfiler.percentiles
+PROFILER_PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """Times each phase of every frame and keeps a rolling history.
+
+    The main loop calls begin_frame(), then mark(phase) after each phase and
+    end_frame() at the end. Each mark charges the time since the previous one
+    to that phase. The last PROFILER_HISTORY frames are kept in a ring buffer
+    for percentiles, and every frame can also be written to a JSONL trace.
+
+    While disabled every call returns straight away, so code that is also
+    used headlessly can mark phases unconditionally.
+    """
+
+    def __init__(self, history=PROFILER_HISTORY):
+        self.phase_index = {phase: i for i, phase in enumerate(PROFILER_PHASES)}
+        self.samples = np.zeros((history, len(PROFILER_PHASES)))
+        self.current = [0.0] * len(PROFILER_PHASES)
+        self.frames = 0
+        self.last_mark = 0.0
+        self.enabled = False
+        self.trace = None
+
+        # HUD state, redrawn every PROFILER_HUD_REFRESH frames
+        self.show_hud = False
+        self.hud_surface = None
+        self.hud_frame = None
+
+    def enable(self, trace_path=None):
+        """Start profiling, optionally writing every frame to a JSONL file."""
+        self.enabled = True
+        if trace_path:
+            self.trace = open(trace_path, "w")
+
+    def close(self):
+        """Stop profiling and close the trace file."""
+        self.enabled = False
+        if self.trace:
+            self.trace.close()
+            self.trace = None
+
+    def toggle_hud(self):
+        """Show or hide the on-screen timings."""
+        self.show_hud = not self.show_hud
+        self.hud_frame = None
+
+    def begin_frame(self):
+        """Start timing a new frame."""
+        if not self.enabled:
+            return
+        self.current = [0.0] * len(PROFILER_PHASES)
+        self.last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        """Charge the time since the last mark to a phase."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current[self.phase_index[phase]] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        """Store the frame's timings in the history and the trace."""
+        if not self.enabled:
+            return
+        self.samples[self.frames % len(self.samples)] = self.current
+        if self.trace:
+            phases = {
+                phase: round(seconds * 1000, 4)
+                for phase, seconds in zip(PROFILER_PHASES, self.current)
+            }
+            self.trace.write(json.dumps({"frame": self.frames, "ms": phases}) + "\n")
+        self.frames += 1
+
+    def percentiles(self):
+        """Rolling percentiles over the kept history.
+
+        Returns:
+            dict of phase name to a list of millisecond values, one per
+            PROFILER_PERCENTILES entry, plus "frame" for the frame's work
+            (every phase except waiting in clock.tick)
+        """
+        count = min(self.frames, len(self.samples))
+        if count == 0:
+            return {}
+        history = self.samples[:count] * 1000
+        work = history[:, : self.phase_index["tick"]].sum(axis=1)
+        table = np.percentile(history, PROFILER_PERCENTILES, axis=0)
+        result = {
+            phase: table[:, i].tolist() for i, phase in enumerate(PROFILER_PHASES)
+        }
+        result["frame"] = np.percentile(work, PROFILER_PERCENTILES).tolist()
+        return result
+
+    def draw_hud(self, screen):
+        """Draw the timings in the top-right corner if the HUD is shown.
+
+        Returns:
+            Rect covering the HUD, or None when hidden
+        """
+        if not self.show_hud or not self.enabled:
+            return None
+        stale = self.hud_frame is None
+        if stale or self.frames - self.hud_frame >= PROFILER_HUD_REFRESH:
+            self.hud_surface = self._render_hud()
+            self.hud_frame = self.frames
+        rect = self.hud_surface.get_rect(topright=(SCREEN_WIDTH - UI_MARGIN, 60))
+        return screen.blit(self.hud_surface, rect)
+
+    def _render_hud(self):
+        """Compose the HUD panel from the current percentiles."""
+        font = get_font(PROFILER_HUD_FONT_SIZE)
+        rows = [["ms"] + [f"p{p}" for p in PROFILER_PERCENTILES]]
+        for phase, values in self.percentiles().items():
+            rows.append([phase] + [f"{value:.2f}" for value in values])
+
+        # Phase names in the first column, values right-aligned after it
+        label_width = 100
+        column_width = 56
+        line_height = font.get_linesize()
+        width = label_width + column_width * len(PROFILER_PERCENTILES) + 16
+        height = line_height * len(rows) + 16
+        panel = pygame.Surface((width, height))
+        panel.fill((0, 0, 0))
+        for row, cells in enumerate(rows):
+            y = 8 + row * line_height
+            panel.blit(font.render(cells[0], True, (255, 255, 255)), (8, y))
+            for column, cell in enumerate(cells[1:], start=1):
+                text = font.render(cell, True, (255, 255, 255))
+                right = 8 + label_width + column * column_width
+                panel.blit(text, (right - text.get_width(), y))
+        return to_display_format(panel)
+
+
+# Shared by the main loop and the renderer
+frame_profiler = FrameProfiler()
@@ -16,11 +16,30 @@ class GameObject(pygame.sprite.Sprite):
 
         self.position = pygame.Vector2(x, y)
         self.velocity = pygame.Vector2(0, 0)
+        self.previous_position = pygame.Vector2(x, y)
 
     def update(self, dt):
         """Update the object's state. Override in subclasses."""
         pass
 
+    def store_previous_position(self):
+        """Remember the position before a simulation step, for interpolation."""
+        self.previous_position.update(self.position)
+
+    def get_render_position(self, alpha=1.0):
+        """Get the position to draw at.
+
+        Args:
+            alpha: How far between the previous and current simulation step
+                to draw, from 0 to 1
+
+        Returns:
+            pygame.Vector2 position
+        """
+        if alpha >= 1.0:
+            return self.position
+        return self.previous_position.lerp(self.position, alpha)
+
     def draw(self, screen):
         """Draw the object. Override in subclasses."""
         pass
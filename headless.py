@@ -0,0 +1,195 @@
+import argparse
+import math
+import time
+import pygame
+from minigame_filling import MinigameFilling
+from constants import *
+
+# Simulation step used for headless runs, the same one the game uses
+HEADLESS_DT = FIXED_DT
+
+# Extra simulated time allowed on top of the round itself before a run is
+# abandoned, so a policy that never starts the game can't loop forever
+HEADLESS_TIME_SLACK = 60
+
+
+def apply_input(minigame, kind, value):
+    """Forward one scripted input to the minigame's event handlers.
+
+    Args:
+        minigame: MinigameFilling receiving the input
+        kind: "motion", "button" or "key"
+        value: Mouse position, pressed flag or pygame key constant
+    """
+    if kind == "motion":
+        minigame.handle_mouse_motion(value)
+    elif kind == "button":
+        minigame.handle_mouse_button(value)
+    elif kind == "key":
+        minigame.handle_key_press(value)
+    else:
+        raise ValueError(f"Unknown input kind: {kind}")
+
+
+class InputScript:
+    """A frame-indexed list of player inputs for headless runs.
+
+    Each event is a (frame, kind, value) tuple where kind is "motion"
+    (value is an (x, y) position), "button" (value is True/False) or "key"
+    (value is a pygame key constant). Events are applied before the update
+    of their frame, in the same order main.py handles them.
+    """
+
+    def __init__(self, events=()):
+        self.events = sorted(events, key=lambda event: event[0])
+        self._next_event = 0
+
+    def add(self, frame, kind, value):
+        """Append an event. Frames must not go backwards."""
+        if self.events and frame < self.events[-1][0]:
+            raise ValueError("Events must be added in frame order")
+        self.events.append((frame, kind, value))
+
+    def reset(self):
+        """Rewind the script so it can drive another round."""
+        self._next_event = 0
+
+    def next_frame(self):
+        """Frame of the first event apply() hasn't reached, or None."""
+        if self._next_event < len(self.events):
+            return self.events[self._next_event][0]
+        return None
+
+    def apply(self, minigame, frame):
+        """Apply every event scheduled up to and including this frame."""
+        while (
+            self._next_event < len(self.events)
+            and self.events[self._next_event][0] <= frame
+        ):
+            _, kind, value = self.events[self._next_event]
+            apply_input(minigame, kind, value)
+            self._next_event += 1
+
+
+class HeadlessRunner:
+    """Runs a filling round without a window, fonts or a frame limiter.
+
+    Drives MinigameFilling.update with a fixed dt and scripted input and
+    never calls draw, so rounds run as fast as the simulation allows.
+    """
+
+    def __init__(
+        self,
+        recipe_path,
+        policy=None,
+        seed=None,
+        dt=HEADLESS_DT,
+        start_immediately=True,
+        max_frames=None,
+        num_tentacles=NUM_TENTACLES,
+    ):
+        """Set up a headless round.
+
+        Args:
+            recipe_path: Path to the recipe JSON file
+            policy: Object with an apply(minigame, frame) method, such as an
+                InputScript, or None for no input
+            seed: Spawn seed passed to MinigameFilling, random if None
+            dt: Seconds simulated per update
+            start_immediately: Press SPACE before the first frame to skip
+                the instructions screen
+            max_frames: Frame limit, defaults to the round length plus slack
+            num_tentacles: Number of arms the octopus has
+        """
+        self.recipe_path = recipe_path
+        self.policy = policy
+        self.seed = seed
+        self.dt = dt
+        self.start_immediately = start_immediately
+        self.max_frames = max_frames
+        self.num_tentacles = num_tentacles
+
+        self.minigame = None
+        self.frames = 0
+        self.wall_time = 0.0
+
+    @property
+    def sim_time(self):
+        """Seconds of gameplay simulated by the last run."""
+        return self.frames * self.dt
+
+    def run(self):
+        """Play one round to completion.
+
+        Returns:
+            The minigame's get_summary() dictionary
+        """
+        self.minigame = MinigameFilling(self.recipe_path, self.seed, self.num_tentacles)
+        self.minigame.start()
+        self.frames = 0
+
+        max_frames = self.max_frames
+        if max_frames is None:
+            round_time = self.minigame.duration + PREP_PHASE_DURATION
+            max_frames = math.ceil((round_time + HEADLESS_TIME_SLACK) / self.dt)
+
+        if self.policy is not None and hasattr(self.policy, "reset"):
+            self.policy.reset()
+        if self.start_immediately:
+            self.minigame.handle_key_press(pygame.K_SPACE)
+
+        start = time.perf_counter()
+        while self.frames < max_frames:
+            if self.policy is not None:
+                self.policy.apply(self.minigame, self.frames)
+            if not self._advance(max_frames):
+                break
+        self.wall_time = time.perf_counter() - start
+
+        return self.minigame.get_summary()
+
+    def _advance(self, max_frames):
+        """Run the next update.
+
+        Args:
+            max_frames: Frame limit of the run
+
+        Returns:
+            False once the round is over
+        """
+        continue_game = self.minigame.update(self.dt)
+        self.frames += 1
+        return continue_game and not self.minigame.is_complete()
+
+    def get_speed(self):
+        """Simulated seconds per wall-clock second for the last run."""
+        if self.wall_time <= 0:
+            return math.inf
+        return self.sim_time / self.wall_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run filling rounds headlessly")
+    parser.add_argument("recipe", nargs="?", default="recipes/apple_pie.json")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--tentacles", type=int, default=NUM_TENTACLES)
+    args = parser.parse_args()
+
+    runner = HeadlessRunner(args.recipe, num_tentacles=args.tentacles)
+    sim_time = 0.0
+    wall_time = 0.0
+    for round_index in range(args.rounds):
+        summary = runner.run()
+        sim_time += runner.sim_time
+        wall_time += runner.wall_time
+        print(
+            f"Round {round_index + 1}: score {summary['score']}/100, "
+            f"{summary['total_ingredients']} ingredients"
+        )
+
+    speed = sim_time / wall_time if wall_time > 0 else math.inf
+    print(f"\nSimulated {sim_time:.1f}s in {wall_time:.3f}s ({speed:.0f}x real time)")
+
+
+if __name__ == "__main__":
+    main()
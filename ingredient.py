@@ -1,55 +1,98 @@
 import pygame
-from game_object import GameObject
+from ingredient_sprites import ingredient_image
 from constants import *
 
 
-class Ingredient(GameObject):
+class Ingredient:
     """A falling ingredient that can be caught by the tentacle.
 
+    Ingredients are spawned in large numbers, so unlike the other game
+    objects they aren't sprites: they use __slots__, small integer states and
+    are recycled through an IngredientPool.
+
     Attributes:
         ingredient_type: String ID like "apple", "berry", "rock"
         category: "good", "bad", or "inedible"
         points: Score value (positive or negative)
         color: RGB color for rendering
+        state: One of the INGREDIENT_* state constants
     """
 
+    __slots__ = (
+        "position",
+        "previous_position",
+        "ingredient_type",
+        "category",
+        "points",
+        "color",
+        "radius",
+        "state",
+        "list_index",
+        "holder",
+    )
+
     def __init__(self, x, y, ingredient_type, category, points, color):
-        super().__init__(x, y)
+        self.position = pygame.Vector2(x, y)
+        self.previous_position = pygame.Vector2(x, y)
+        self.radius = INGREDIENT_RADIUS
+        self.list_index = -1  # Slot in the IngredientList holding it
+        self.reset(x, y, ingredient_type, category, points, color)
+
+    def reset(self, x, y, ingredient_type, category, points, color):
+        """Reinitialize the ingredient so it can be spawned again."""
+        self.position.update(x, y)
+        self.previous_position.update(x, y)
         self.ingredient_type = ingredient_type
         self.category = category
         self.points = points
         self.color = color
-        self.radius = INGREDIENT_RADIUS
-        self.state = "falling"  # falling, grabbed, in_crust, missed
-        self.velocity = pygame.Vector2(0, INGREDIENT_FALL_SPEED)
+        self.state = INGREDIENT_FALLING
+        self.holder = None  # Tentacle holding the ingredient while grabbed
 
     def update(self, dt):
         """Update ingredient position based on state."""
-        if self.state == "falling":
+        if self.state == INGREDIENT_FALLING:
             # Fall downward at constant speed
-            self.position += self.velocity * dt
-        elif self.state == "grabbed":
-            # Ingredients don't update position when grabbed
-            # They'll be positioned by the tentacle
-            pass
-
-    def draw(self, screen):
-        """Draw the ingredient as a colored circle with a label."""
-        # Draw the main ingredient circle
-        pygame.draw.circle(
-            screen,
-            self.color,
-            (int(self.position.x), int(self.position.y)),
-            self.radius,
-        )
+            self.position.y += INGREDIENT_FALL_SPEED * dt
+        elif self.state == INGREDIENT_GRABBED:
+            # Follow the tentacle holding it, reusing our own Vector2
+            self.position.update(self.holder.position)
+
+    def store_previous_position(self):
+        """Remember the position before a simulation step, for interpolation."""
+        self.previous_position.update(self.position)
+
+    def get_render_position(self, alpha=1.0):
+        """Get the position to draw at.
+
+        Args:
+            alpha: How far between the previous and current simulation step
+                to draw, from 0 to 1
 
-        # Draw a darker outline
-        pygame.draw.circle(
-            screen,
-            tuple(max(0, c - 50) for c in self.color),
-            (int(self.position.x), int(self.position.y)),
-            self.radius,
-            2,
+        Returns:
+            pygame.Vector2 position
+        """
+        if alpha >= 1.0:
+            return self.position
+        return self.previous_position.lerp(self.position, alpha)
+
+    def draw(self, screen, alpha=1.0):
+        """Draw the ingredient's pre-rendered circle on its own.
+
+        Minigames draw all their ingredients at once through
+        IngredientSprites instead.
+
+        Args:
+            screen: Surface to draw on
+            alpha: Interpolation between the last two simulation steps
+
+        Returns:
+            Rect covering the ingredient
+        """
+        position = self.get_render_position(alpha)
+        return screen.blit(
+            ingredient_image(self.color, self.radius),
+            (int(position.x) - self.radius, int(position.y) - self.radius),
         )
 
     def is_off_screen(self):
@@ -71,3 +114,23 @@ class Ingredient(GameObject):
             distance = self.position.distance_to(other.position)
             return distance <= (self.radius + other.radius)
         return False
+
+
+class IngredientPool:
+    """Free list of ingredients that left play, reused for new spawns."""
+
+    def __init__(self):
+        self.free = []
+
+    def acquire(self, x, y, ingredient_type, category, points, color):
+        """Get a falling ingredient, reusing a released one if possible."""
+        if self.free:
+            ingredient = self.free.pop()
+            ingredient.reset(x, y, ingredient_type, category, points, color)
+            return ingredient
+        return Ingredient(x, y, ingredient_type, category, points, color)
+
+    def release(self, ingredient):
+        """Return an ingredient nothing refers to anymore."""
+        ingredient.set_state(INGREDIENT_MISSED)
+        self.free.append(ingredient)
@@ -0,0 +1,52 @@
+class IngredientList:
+    """Ordered collection of ingredients in play with O(1) removal.
+
+    Removing an ingredient leaves a hole in its slot instead of shifting the
+    rest down. Iteration skips holes, so it's safe to remove while looping,
+    and compact() squeezes them out later in one pass. Ingredients keep the
+    order they were added in, which is also the order they're drawn in.
+    """
+
+    # Compact once at least this fraction of the slots are holes
+    COMPACT_RATIO = 0.5
+
+    def __init__(self):
+        self.slots = []
+        self.count = 0
+
+    def append(self, ingredient):
+        """Add an ingredient after all the others."""
+        ingredient.list_index = len(self.slots)
+        self.slots.append(ingredient)
+        self.count += 1
+
+    def remove(self, ingredient):
+        """Remove an ingredient, leaving a hole until the next compaction.
+
+        Raises:
+            ValueError: If the ingredient isn't in the list, like list.remove
+        """
+        if ingredient not in self:
+            raise ValueError("IngredientList.remove(x): x not in list")
+        self.slots[ingredient.list_index] = None
+        ingredient.list_index = -1
+        self.count -= 1
+
+    def compact(self):
+        """Squeeze out holes if there are enough of them to be worth it."""
+        holes = len(self.slots) - self.count
+        if holes == 0 or holes < len(self.slots) * self.COMPACT_RATIO:
+            return
+        self.slots = [ingredient for ingredient in self.slots if ingredient is not None]
+        for index, ingredient in enumerate(self.slots):
+            ingredient.list_index = index
+
+    def __iter__(self):
+        return filter(None, self.slots)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, ingredient):
+        index = ingredient.list_index
+        return 0 <= index < len(self.slots) and self.slots[index] is ingredient
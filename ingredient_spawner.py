@@ -1,30 +1,119 @@
 import pygame
 import random
-from ingredient import Ingredient
+import numpy as np
+from alias_sampler import AliasSampler
+from ingredient import IngredientPool
 from constants import *
 
+# Spawns drawn at a time when the pre-generated ones run out
+SPAWN_BLOCK_SIZE = 256
+
+
+class SpawnSchedule:
+    """A round's spawns as parallel arrays.
+
+    Attributes:
+        frames: Active-phase frame index (0-based) of each spawn
+        times: Elapsed round time at each spawn
+        types: Ingredient type ids, indexing Recipe.ingredient_types
+        xs: Spawn x positions
+    """
+
+    def __init__(self, frames, times, types, xs):
+        self.frames = frames
+        self.times = times
+        self.types = types
+        self.xs = xs
+
+    def __len__(self):
+        return len(self.frames)
+
 
 class IngredientSpawner:
     """Spawns ingredients from the top of the screen based on recipe data."""
 
-    def __init__(self, recipe):
+    def __init__(self, recipe, seed=None):
         """Initialize the spawner with a recipe.
 
         Args:
             recipe: Recipe object containing spawn rates and ingredient data
+            seed: Seed for spawn types and positions, random if None
         """
         self.recipe = recipe
         self.spawn_timer = 0
         self.spawn_interval = INGREDIENT_SPAWN_INTERVAL
 
-        # Build a weighted list of ingredient types for random selection
-        self.ingredient_types = []
-        self.weights = []
-        for ing_type in recipe.get_all_ingredient_types():
-            probability = recipe.get_spawn_probability(ing_type)
-            if probability > 0:
-                self.ingredient_types.append(ing_type)
-                self.weights.append(probability)
+        # Alias table over the spawnable types, precomputed by the recipe
+        self.ingredient_types = recipe.spawn_types
+        self.type_ids = np.array(
+            [recipe.type_ids[t] for t in self.ingredient_types], dtype=np.int64
+        )
+        self.sampler = (
+            AliasSampler(recipe.spawn_weights) if self.ingredient_types else None
+        )
+
+        # Types and positions come from separate streams drawn in blocks, so
+        # the n-th spawn is the same however far ahead it was generated
+        if seed is None:
+            seed = random.randrange(2**63)
+        self.type_rng = np.random.default_rng([seed, 0])
+        self.x_rng = np.random.default_rng([seed, 1])
+        self.types = np.zeros(0, dtype=np.int64)
+        self.xs = np.zeros(0, dtype=np.int64)
+        self.spawned = 0
+
+        # Ingredients that left play, recycled by spawn()
+        self.pool = IngredientPool()
+
+    def _generate(self, count):
+        """Make sure at least count spawns have been drawn."""
+        if count <= len(self.types):
+            return
+        block = max(count - len(self.types), SPAWN_BLOCK_SIZE)
+        types = self.type_ids[self.sampler.sample(self.type_rng.random(block))]
+        x_range = SCREEN_WIDTH - 2 * INGREDIENT_RADIUS + 1
+        xs = INGREDIENT_RADIUS + (self.x_rng.random(block) * x_range).astype(np.int64)
+        self.types = np.concatenate((self.types, types))
+        self.xs = np.concatenate((self.xs, xs))
+
+    def schedule(self, duration, dt=FIXED_DT):
+        """Pre-generate every spawn of a round.
+
+        Replays the spawn timer at a fixed timestep up to the frame the round
+        ends on. The types and positions are the ones spawn() hands out, in
+        the same order.
+
+        Args:
+            duration: Length of the active phase in seconds
+            dt: Seconds per frame
+
+        Returns:
+            SpawnSchedule for the round
+        """
+        frames = []
+        times = []
+        elapsed = 0
+        spawn_timer = 0
+        frame = 0
+        while True:
+            elapsed += dt
+            spawn_timer += dt
+            if spawn_timer >= self.spawn_interval:
+                spawn_timer = 0
+                frames.append(frame)
+                times.append(elapsed)
+            if elapsed >= duration:
+                break
+            frame += 1
+
+        count = len(frames) if self.sampler is not None else 0
+        self._generate(count)
+        return SpawnSchedule(
+            np.array(frames[:count], dtype=np.int64),
+            np.array(times[:count]),
+            self.types[:count],
+            self.xs[:count],
+        )
 
     def update(self, dt):
         """Update the spawn timer."""
@@ -38,27 +127,32 @@ class IngredientSpawner:
         return False
 
     def spawn(self):
-        """Spawn a random ingredient based on recipe spawn rates.
+        """Spawn the next ingredient of the round.
 
         Returns:
             Ingredient object or None if no types available
         """
-        if not self.ingredient_types:
+        if self.sampler is None:
             return None
 
-        # Choose a random ingredient type based on weights
-        ingredient_type = random.choices(self.ingredient_types, weights=self.weights)[0]
+        self._generate(self.spawned + 1)
+        type_id = self.types[self.spawned]
+        x = int(self.xs[self.spawned])
+        self.spawned += 1
 
-        # Get ingredient data from recipe
+        ingredient_type = self.recipe.ingredient_types[type_id]
         data = self.recipe.get_ingredient_data(ingredient_type)
-        if not data:
-            return None
 
-        # Random X position across the screen
-        x = random.randint(INGREDIENT_RADIUS, SCREEN_WIDTH - INGREDIENT_RADIUS)
-        y = INGREDIENT_SPAWN_Y
-
-        # Create and return the ingredient
-        return Ingredient(
-            x, y, ingredient_type, data["category"], data["points"], data["color"]
+        # Take an ingredient from the pool and return it
+        return self.pool.acquire(
+            x,
+            INGREDIENT_SPAWN_Y,
+            ingredient_type,
+            data["category"],
+            data["points"],
+            data["color"],
         )
+
+    def recycle(self, ingredient):
+        """Give back an ingredient that went off screen so it can respawn."""
+        self.pool.release(ingredient)
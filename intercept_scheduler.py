@@ -0,0 +1,201 @@
+import heapq
+import math
+import numpy as np
+from constants import *
+
+# Extra distance (px) allowed in predictions so rounding can only make an arm
+# wake early, never late
+INTERCEPT_SLACK = 1e-6
+
+
+class InterceptScheduler:
+    """Predicts when idle arms can next catch something, so they can sleep.
+
+    An idle arm that has stopped moving ("parked") can only catch a falling
+    ingredient once the ingredient's straight, constant-speed fall brings it
+    into reach. When an arm parks, and whenever an ingredient starts falling,
+    the frame each ingredient comes into reach of each parked arm is pushed
+    onto a heap. A parked arm sleeps until one of its frames comes up, then
+    runs the normal collision test every frame until that ingredient has
+    fallen past. The predicted window is widened by a step at each end, so
+    the exact test runs on every frame the polling version would have
+    caught something on.
+
+    Arms carrying an ingredient to the crust get the same treatment: their
+    tips close in on the crust geometrically, so the frame they can first be
+    over it is computed when they set off, and the crust test only runs from
+    then on.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, dt=None):
+        """Forget every prediction, waking all arms.
+
+        Args:
+            dt: Step length the next predictions are made for
+        """
+        self.dt = dt
+        self.heap = []
+        self.sequence = 0  # Tie-breaker so heap entries never compare arms
+        self.parked = {}  # Sleeping-capable arm -> epoch it parked in
+        self.awake_until = {}  # Parked arm -> last frame it must be tested on
+        self.last_positions = {}  # Moving idle arm -> tip position last frame
+        self.new_falling = []  # Ingredients that started falling since last frame
+        self.crust_frames = {}  # Carrying arm -> first frame it can reach the crust
+        self.epoch = 0
+
+    def add_falling(self, ingredient):
+        """Note an ingredient that was spawned or dropped and is now falling."""
+        self.new_falling.append(ingredient)
+
+    def waiting(self, tentacles, ingredients, frame, dt):
+        """Pick the idle arms that need a collision test this frame.
+
+        Call once per update, after everything has moved.
+
+        Args:
+            tentacles: Every arm, in grab priority order
+            ingredients: Every ingredient in play
+            frame: Number of the current update
+            dt: Seconds simulated per update
+
+        Returns:
+            List of the idle arms that could be touching a falling
+            ingredient, in the same order as tentacles
+        """
+        if dt != self.dt:
+            self.reset(dt)
+
+        # New ingredients can be in reach straight away
+        for ingredient in self.new_falling:
+            for tentacle, epoch in self.parked.items():
+                self._schedule(tentacle, epoch, ingredient, frame)
+        self.new_falling.clear()
+
+        heap = self.heap
+        while heap and heap[0][0] <= frame:
+            _, _, tentacle, epoch, ingredient = heapq.heappop(heap)
+            if self.parked.get(tentacle) == epoch:
+                self._schedule(tentacle, epoch, ingredient, frame)
+
+        waiting = []
+        parking = []
+        awake_until = self.awake_until
+        for tentacle in tentacles:
+            if tentacle.is_active or tentacle.is_grabbing:
+                if tentacle in self.parked:
+                    del self.parked[tentacle]
+                    awake_until.pop(tentacle, None)
+                self.last_positions.pop(tentacle, None)
+                # Only idle arms carry things to the crust on their own
+                if tentacle.is_active:
+                    self.crust_frames.pop(tentacle, None)
+                continue
+            self.crust_frames.pop(tentacle, None)
+            if tentacle in self.parked:
+                if awake_until.get(tentacle, -1) >= frame:
+                    waiting.append(tentacle)
+                continue
+
+            # Moving arms are tested every frame. One that didn't move this
+            # step won't move again until it's selected or grabs something.
+            waiting.append(tentacle)
+            position = (tentacle.position.x, tentacle.position.y)
+            if self.last_positions.get(tentacle) == position:
+                del self.last_positions[tentacle]
+                parking.append(tentacle)
+            else:
+                self.last_positions[tentacle] = position
+
+        if parking:
+            self._park(parking, ingredients, frame)
+        return waiting
+
+    def may_reach_crust(self, tentacle, crust, frame):
+        """Check whether a carrying arm can be over the crust yet.
+
+        The first call for a trip predicts the arrival; call it every frame
+        the arm heads for the crust.
+
+        Args:
+            tentacle: Inactive arm carrying an ingredient to the crust
+            crust: PieCrust the arm is heading for
+            frame: Number of the current update
+
+        Returns:
+            False while the arm is certainly too far away for the crust test
+        """
+        arrival = self.crust_frames.get(tentacle)
+        if arrival is None:
+            arrival = frame + self._crust_steps(tentacle, crust)
+            self.crust_frames[tentacle] = arrival
+        return frame >= arrival
+
+    def _crust_steps(self, tentacle, crust):
+        """Updates before an arm starting out now can be over the crust."""
+        # Over the crust means within its half diagonal of the center
+        reach = math.hypot(crust.width // 2, crust.height // 2) + INTERCEPT_SLACK
+        distance = tentacle.position.distance_to(crust.position)
+        smoothing_factor = min(TENTACLE_SMOOTHING * self.dt, 1.0)
+        if distance <= reach:
+            return 0
+        if smoothing_factor >= 1.0:
+            return 1
+        # The gap shrinks by (1 - smoothing_factor) each update
+        steps = math.ceil(math.log(reach / distance) / math.log(1 - smoothing_factor))
+        return max(1, steps - 1)
+
+    def _park(self, tentacles, ingredients, frame):
+        """Let arms sleep, scheduling their wake-ups for what's falling now."""
+        falling = [
+            ingredient
+            for ingredient in ingredients
+            if ingredient.state == INGREDIENT_FALLING
+        ]
+        xs = np.array([ingredient.position.x for ingredient in falling])
+        for tentacle in tentacles:
+            self.epoch += 1
+            self.parked[tentacle] = self.epoch
+            # Only ingredients falling through the arm's column can reach it
+            reach = tentacle.tip_radius + INGREDIENT_RADIUS + INTERCEPT_SLACK
+            column = np.flatnonzero(np.abs(xs - tentacle.position.x) <= reach)
+            for index in column.tolist():
+                self._schedule(tentacle, self.epoch, falling[index], frame)
+
+    def _schedule(self, tentacle, epoch, ingredient, frame):
+        """Plan when a parked arm must test for an ingredient.
+
+        If the ingredient is already in reach the arm stays awake until it
+        has fallen past, otherwise a wake-up is pushed for when it arrives.
+
+        Args:
+            tentacle: Parked arm
+            epoch: Epoch the arm parked in
+            ingredient: Ingredient that may fall into reach
+            frame: Number of the current update
+        """
+        if ingredient.state != INGREDIENT_FALLING:
+            return
+        reach = tentacle.tip_radius + ingredient.radius + INTERCEPT_SLACK
+        dx = ingredient.position.x - tentacle.position.x
+        if abs(dx) > reach:
+            return
+        # Falling straight down, it's in reach while within this of the tip
+        # vertically, widened by a step either side
+        step = INGREDIENT_FALL_SPEED * self.dt
+        half_height = math.sqrt(max(0.0, reach * reach - dx * dx)) + step
+        y = ingredient.position.y
+        if y > tentacle.position.y + half_height:
+            return
+        steps = math.ceil((tentacle.position.y - half_height - y) / step)
+        if steps > 0:
+            self.sequence += 1
+            heapq.heappush(
+                self.heap, (frame + steps, self.sequence, tentacle, epoch, ingredient)
+            )
+            return
+        last = frame + math.floor((tentacle.position.y + half_height - y) / step)
+        if last > self.awake_until.get(tentacle, -1):
+            self.awake_until[tentacle] = last
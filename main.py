@@ -1,10 +1,114 @@
+import argparse
+import os
 import pygame
 import sys
+import time
 from constants import *
 from minigame_filling import MinigameFilling
+from dirty_renderer import DirtyRectRenderer
+from display_setup import describe_display, open_display
+from frame_profiler import frame_profiler
+from overlay import Overlay
+from replay import InputRecorder
+from sim_thread import SimulationThread, SnapshotScene
+from text_cache import render_text
+
+RECIPE_PATH = "recipes/apple_pie.json"
+
+
+def new_round(record_dir, num_tentacles=NUM_TENTACLES, threaded=False):
+    """Create and start a minigame.
+
+    Returns:
+        (minigame, controls, simulation) where controls receives input
+        events: the minigame itself, or a recorder wrapping it when
+        recording. simulation is the running SimulationThread stepping
+        the minigame when threaded, and None otherwise.
+    """
+    minigame = MinigameFilling(RECIPE_PATH, num_tentacles=num_tentacles)
+    minigame.start()
+    controls = minigame
+    if record_dir:
+        controls = InputRecorder(minigame, RECIPE_PATH)
+    if not threaded:
+        return minigame, controls, None
+    simulation = SimulationThread(minigame, controls)
+    simulation.start()
+    return minigame, controls, simulation
+
+
+def build_game_over_overlay(summary):
+    """Composite the game over screen for a finished round.
+
+    Args:
+        summary: Dictionary from MinigameFilling.get_summary()
+
+    Returns:
+        Overlay darkening the screen behind the results
+    """
+    center_x = SCREEN_WIDTH // 2
+
+    # Game Over text
+    game_over_text = render_text(64, "Pie Complete!", (255, 255, 255))
+    texts = [(game_over_text, (center_x, SCREEN_HEIGHT // 3))]
+
+    # Score
+    score_text = render_text(64, f"Score: {summary['score']}/100", COLOR_SCORE)
+    texts.append((score_text, (center_x, SCREEN_HEIGHT // 2)))
+
+    # Requirements summary
+    y_offset = SCREEN_HEIGHT // 2 + 60
+    for ing_type, data in summary["requirements_met"].items():
+        color = COLOR_SCORE if data["met"] else COLOR_TIMER
+        status = "✓" if data["met"] else "✗"
+        req_text = render_text(
+            32,
+            f"{status} {ing_type}: {data['collected']}/{data['required']}",
+            color,
+        )
+        texts.append((req_text, (center_x, y_offset)))
+        y_offset += 35
+
+    # Instructions
+    restart_text = render_text(32, "Press SPACE to play again", (200, 200, 200))
+    texts.append((restart_text, (center_x, SCREEN_HEIGHT - 60)))
+    quit_text = render_text(32, "Press ESC to quit", (200, 200, 200))
+    texts.append((quit_text, (center_x, SCREEN_HEIGHT - 30)))
+
+    # Semi-transparent overlay
+    return Overlay(texts, dim_alpha=200)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Octopied")
+    parser.add_argument(
+        "--record", metavar="DIR", help="Save a replay of every round into DIR"
+    )
+    parser.add_argument(
+        "--tentacles",
+        type=int,
+        default=NUM_TENTACLES,
+        help="Number of arms the octopus has",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        metavar="FILE",
+        help="Write per-frame phase timings to FILE as JSON lines",
+    )
+    parser.add_argument(
+        "--threaded",
+        action="store_true",
+        help="Run the simulation on its own thread, separate from drawing",
+    )
+    parser.add_argument(
+        "--scaled",
+        action="store_true",
+        help="Scale the window to fit the desktop, with vsync where available",
+    )
+    args = parser.parse_args()
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+
     # Initialize pygame
     pygame.init()
     clock = pygame.time.Clock()
@@ -13,61 +117,117 @@ def main():
     print(f"Screen width: {SCREEN_WIDTH}")
     print(f"Screen height: {SCREEN_HEIGHT}")
 
-    # Create the screen
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Create the screen before anything that gets drawn is cached, so cached
+    # surfaces match its pixel format
+    screen, display_config = open_display(args.scaled)
+    print(f"Display: {describe_display(display_config)}")
     pygame.display.set_caption("Octopied - Pie Filling Minigame")
+    renderer = DirtyRectRenderer()
 
     # Create the minigame
-    minigame = MinigameFilling("recipes/apple_pie.json")
-    minigame.start()
+    minigame, controls, simulation = new_round(
+        args.record, args.tentacles, args.threaded
+    )
+    # Input goes through the simulation thread when there is one
+    inputs = simulation or controls
+    scene = SnapshotScene(minigame) if simulation else None
+
+    # Time every frame's phases; F3 shows the timings on screen
+    frame_profiler.enable(args.profile_trace)
 
     # Game state
     game_complete = False
+    game_over_overlay = None
     dt = 0
+    # Real time not yet simulated, consumed in FIXED_DT steps
+    accumulator = 0.0
 
     # Main game loop
     while True:
+        frame_profiler.begin_frame()
+
         # Handle events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                if simulation:
+                    simulation.stop()
+                frame_profiler.close()
                 pygame.quit()
                 sys.exit()
 
             elif event.type == pygame.MOUSEMOTION:
                 # Update tentacle target position
-                minigame.handle_mouse_motion(event.pos)
+                inputs.handle_mouse_motion(event.pos)
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left mouse button
-                    minigame.handle_mouse_button(True)
+                    inputs.handle_mouse_button(True)
 
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1:  # Left mouse button
-                    minigame.handle_mouse_button(False)
+                    inputs.handle_mouse_button(False)
 
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
+                    if simulation:
+                        simulation.stop()
+                    frame_profiler.close()
                     pygame.quit()
                     sys.exit()
+                elif event.key == pygame.K_F3:
+                    # Toggle the frame timing HUD
+                    frame_profiler.toggle_hud()
                 elif event.key == pygame.K_SPACE and game_complete:
                     # Restart game
-                    minigame = MinigameFilling("recipes/apple_pie.json")
-                    minigame.start()
+                    minigame, controls, simulation = new_round(
+                        args.record, args.tentacles, args.threaded
+                    )
+                    inputs = simulation or controls
+                    scene = SnapshotScene(minigame) if simulation else None
                     game_complete = False
+                    game_over_overlay = None
+                    accumulator = 0.0
                 elif not game_complete:
-                    # Handle tentacle switching (keys 1-4)
-                    minigame.handle_key_press(event.key)
+                    # Handle tentacle switching (number keys or TAB)
+                    inputs.handle_key_press(event.key)
+
+        frame_profiler.mark("events")
 
         if not game_complete:
-            # Update game
-            continue_game = minigame.update(dt)
+            if simulation:
+                # The simulation thread steps on its own; draw its latest step
+                snapshot = simulation.snapshot
+                game_complete = snapshot.complete
+                if game_complete:
+                    # The thread has finished, so the minigame is ours again
+                    simulation.stop()
+                frame_profiler.mark("update")
+
+                scene.set_snapshot(snapshot)
+                renderer.draw(screen, scene, simulation.get_alpha(snapshot))
+            else:
+                # Update game in fixed steps so frame hitches don't change
+                # gameplay
+                accumulator += min(dt, MAX_FRAME_TIME)
+                while accumulator >= FIXED_DT and not game_complete:
+                    minigame.store_previous_positions()
+                    continue_game = minigame.update(FIXED_DT)
+                    accumulator -= FIXED_DT
+                    # Check if game is complete
+                    game_complete = not continue_game or minigame.is_complete()
+                frame_profiler.mark("update")
 
-            # Draw game
-            minigame.draw(screen)
+                # Draw game between the last two steps
+                renderer.draw(screen, minigame, accumulator / FIXED_DT)
 
-            # Check if game is complete
-            if not continue_game or minigame.is_complete():
-                game_complete = True
+            if game_complete:
+                if args.record:
+                    replay_path = os.path.join(
+                        args.record,
+                        f"{time.strftime('%Y%m%d-%H%M%S')}-{minigame.seed}.octr",
+                    )
+                    controls.recording.save(replay_path)
+                    print(f"\nSaved replay to {replay_path}")
                 print("\nGame Complete!")
                 summary = minigame.get_summary()
                 print(f"Recipe: {summary['recipe_name']}")
@@ -84,69 +244,27 @@ def main():
                     )
         else:
             # Show game over screen
-            minigame.draw(screen)
-
-            # Draw game over overlay
-            font = pygame.font.Font(None, 64)
-            small_font = pygame.font.Font(None, 32)
-
-            # Semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill((0, 0, 0))
-            screen.blit(overlay, (0, 0))
-
-            # Game Over text
-            game_over_text = font.render("Pie Complete!", True, (255, 255, 255))
-            game_over_rect = game_over_text.get_rect(
-                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3)
-            )
-            screen.blit(game_over_text, game_over_rect)
-
-            # Score
-            summary = minigame.get_summary()
-            score_text = font.render(
-                f"Score: {summary['score']}/100", True, COLOR_SCORE
-            )
-            score_rect = score_text.get_rect(
-                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-            )
-            screen.blit(score_text, score_rect)
-
-            # Requirements summary
-            y_offset = SCREEN_HEIGHT // 2 + 60
-            for ing_type, data in summary["requirements_met"].items():
-                color = COLOR_SCORE if data["met"] else COLOR_TIMER
-                status = "✓" if data["met"] else "✗"
-                req_text = small_font.render(
-                    f"{status} {ing_type}: {data['collected']}/{data['required']}",
-                    True,
-                    color,
-                )
-                req_rect = req_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-                screen.blit(req_text, req_rect)
-                y_offset += 35
-
-            # Instructions
-            restart_text = small_font.render(
-                "Press SPACE to play again", True, (200, 200, 200)
-            )
-            restart_rect = restart_text.get_rect(
-                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)
-            )
-            screen.blit(restart_text, restart_rect)
-
-            quit_text = small_font.render("Press ESC to quit", True, (200, 200, 200))
-            quit_rect = quit_text.get_rect(
-                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30)
-            )
-            screen.blit(quit_text, quit_rect)
+            renderer.draw(screen, minigame)
+
+            # Draw game over overlay, built once when the round ended
+            if game_over_overlay is None:
+                game_over_overlay = build_game_over_overlay(minigame.get_summary())
+            renderer.add_rect(game_over_overlay.draw(screen))
+
+        # Frame timings, if toggled on
+        hud_rect = frame_profiler.draw_hud(screen)
+        if hud_rect:
+            renderer.add_rect(hud_rect)
+        frame_profiler.mark("ui")
 
         # Update display
-        pygame.display.flip()
+        renderer.present()
+        frame_profiler.mark("flip")
 
         # Limit to 60 FPS and get delta time
         dt = clock.tick(60) / 1000
+        frame_profiler.mark("tick")
+        frame_profiler.end_frame()
 
 
 if __name__ == "__main__":
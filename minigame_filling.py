@@ -1,12 +1,36 @@
 import pygame
+import random
+from collections import namedtuple
 from minigame_base import MinigameBase
 from octopus import Octopus
-from tentacle import Tentacle
+from tentacle import TentacleGroup, tentacle_for_key, update_curves
 from pie_crust import PieCrust
 from ingredient_spawner import IngredientSpawner
-from recipe import Recipe
+from recipe import load_recipe
+from ingredient_list import IngredientList
+from intercept_scheduler import InterceptScheduler
+from spatial_grid import SpatialGrid
+from frame_profiler import frame_profiler
+from static_layer import static_layers
+from text_cache import render_text
+from overlay import Overlay
+from ingredient_sprites import IngredientSprites
 from constants import *
 
+# Values shown by the UI, captured by MinigameFilling.get_hud_state. Requirements
+# are (ingredient type, collected, required) tuples.
+HudState = namedtuple(
+    "HudState",
+    [
+        "instructions_phase",
+        "prep_phase",
+        "countdown",
+        "remaining_time",
+        "score",
+        "requirements",
+    ],
+)
+
 
 class MinigameFilling(MinigameBase):
     """Pie filling minigame where player catches falling ingredients.
@@ -15,37 +39,51 @@ class MinigameFilling(MinigameBase):
     Score is based on collecting the right ingredients and avoiding bad ones.
     """
 
-    def __init__(self, recipe_path):
+    def __init__(self, recipe_path, seed=None, num_tentacles=NUM_TENTACLES):
         """Initialize the filling minigame.
 
         Args:
             recipe_path: Path to the recipe JSON file
+            seed: Seed for ingredient spawns; the same seed and inputs always
+                play out the same round. A random seed is picked if None.
+            num_tentacles: Number of arms the octopus has
         """
         # Load recipe first to get duration
-        self.recipe = Recipe(recipe_path)
+        self.recipe = load_recipe(recipe_path)
         super().__init__(self.recipe.duration)
 
         # Initialize game objects
         self.octopus = Octopus(OCTOPUS_X, OCTOPUS_Y)
 
         # Create multiple tentacles
-        self.tentacles = []
-        for i in range(NUM_TENTACLES):
-            tentacle = Tentacle(self.octopus, i, TENTACLE_ANGLES[i])
-            self.tentacles.append(tentacle)
+        self.num_tentacles = num_tentacles
+        self.tentacles = TentacleGroup(self.octopus, num_tentacles)
 
         # Set first tentacle as active
         self.active_tentacle_index = 0
         self.tentacles[0].is_active = True
 
-        self.pie_crust = PieCrust(PIE_CRUST_X, PIE_CRUST_Y)
-        self.spawner = IngredientSpawner(self.recipe)
+        self.pie_crust = PieCrust(PIE_CRUST_X, PIE_CRUST_Y, self.recipe)
+        self.score_tracker = self.pie_crust.score_tracker
+        if seed is None:
+            seed = random.randrange(2**63)
+        self.seed = seed
+        self.spawner = IngredientSpawner(self.recipe, seed)
 
         # Lists to track ingredients
-        self.falling_ingredients = []
+        self.falling_ingredients = IngredientList()
         self.ingredients_in_crust = []
 
+        # Broadphase for tentacle grabs, holding everything in
+        # falling_ingredients keyed by spawn order
+        self.ingredient_grid = SpatialGrid(INGREDIENT_RADIUS + TENTACLE_TIP_RADIUS)
+        self.spawn_count = 0
+
+        # Wakes idle arms only when something can actually reach them
+        self.intercepts = InterceptScheduler()
+
         # Game state
+        self.frame = 0  # Number of update() calls so far
         self.mouse_pos = (OCTOPUS_X, OCTOPUS_Y)
         self.mouse_pressed = False
         
@@ -54,10 +92,13 @@ class MinigameFilling(MinigameBase):
         self.prep_phase = False 
         self.prep_time_remaining = PREP_PHASE_DURATION
 
-        # Initialize font for UI
-        pygame.font.init()
-        self.font = pygame.font.Font(None, UI_FONT_SIZE)
-        self.small_font = pygame.font.Font(None, UI_SMALL_FONT_SIZE)
+        # Pre-composited overlays, built the first time each is shown
+        self.instructions_overlay = None
+        self.countdown_overlay = None
+        self.countdown_shown = None
+
+        # Pre-rendered ingredient sprites, built the first time one is drawn
+        self.ingredient_sprites = None
 
     def start(self):
         """Initialize the minigame state."""
@@ -71,6 +112,8 @@ class MinigameFilling(MinigameBase):
         Returns:
             True if minigame should continue, False if complete
         """
+        self.frame += 1
+
         # Instructions phase - no updates needed, waiting for user to skip
         if self.instructions_phase:
             return True
@@ -95,8 +138,7 @@ class MinigameFilling(MinigameBase):
             active_tentacle.set_target(self.mouse_pos)
 
         # Update all tentacles' physics
-        for tentacle in self.tentacles:
-            tentacle.update(dt)
+        self.tentacles.update(dt)
 
         # Update spawner and spawn new ingredients (only after prep phase)
         if not self.prep_phase:
@@ -104,38 +146,35 @@ class MinigameFilling(MinigameBase):
             if self.spawner.should_spawn():
                 new_ingredient = self.spawner.spawn()
                 if new_ingredient:
-                    self.falling_ingredients.append(new_ingredient)
+                    self.add_ingredient(new_ingredient)
 
         # Update all falling ingredients
-        for ingredient in self.falling_ingredients[:]:
-            if ingredient.state == "falling":
+        for ingredient in self.falling_ingredients:
+            if ingredient.state == INGREDIENT_FALLING:
                 ingredient.update(dt)
 
                 # Check if ingredient fell off screen
                 if ingredient.is_off_screen():
                     self.falling_ingredients.remove(ingredient)
-                    ingredient.set_state("missed")
+                    self.ingredient_grid.remove(ingredient)
+                    self.spawner.recycle(ingredient)
+                else:
+                    self.ingredient_grid.move(ingredient)
 
-            elif ingredient.state == "grabbed":
+            elif ingredient.state == INGREDIENT_GRABBED:
                 # Grabbed ingredient follows the tentacle that grabbed it
-                # Find which tentacle is holding this ingredient
-                for tentacle in self.tentacles:
-                    if tentacle.grabbed_object == ingredient:
-                        ingredient.position = tentacle.position.copy()
-                        break
+                ingredient.update(dt)
+                self.ingredient_grid.move(ingredient)
 
         # Handle grabbing logic for active tentacle only
         if self.mouse_pressed and not active_tentacle.is_grabbing:
             # Try to grab an ingredient with active tentacle
-            for ingredient in self.falling_ingredients:
-                if ingredient.state == "falling" and active_tentacle.collides_with(
-                    ingredient
-                ):
-                    # Grab this ingredient
-                    active_tentacle.set_grabbing(True)
-                    active_tentacle.grab_object(ingredient)
-                    ingredient.set_state("grabbed")
-                    break
+            ingredient = active_tentacle.find_grabbable(self.ingredient_grid)
+            if ingredient:
+                # Grab this ingredient
+                active_tentacle.set_grabbing(True)
+                active_tentacle.grab_object(ingredient)
+                ingredient.set_state(INGREDIENT_GRABBED)
 
         elif not self.mouse_pressed and active_tentacle.is_grabbing:
             # Release the grabbed ingredient from active tentacle
@@ -146,8 +185,9 @@ class MinigameFilling(MinigameBase):
                 # Check if ingredient lands in crust
                 if self.pie_crust.collides_with(released):
                     # Successfully dropped in crust
-                    released.set_state("in_crust")
+                    released.set_state(INGREDIENT_IN_CRUST)
                     self.falling_ingredients.remove(released)
+                    self.ingredient_grid.remove(released)
                     self.pie_crust.add_ingredient(released)
                     self.ingredients_in_crust.append(released)
 
@@ -156,30 +196,38 @@ class MinigameFilling(MinigameBase):
                         self.is_active = False
                 else:
                     # Dropped outside crust, let it continue falling
-                    released.set_state("falling")
+                    released.set_state(INGREDIENT_FALLING)
+                    self.intercepts.add_falling(released)
 
-        # Auto-grab and auto-drop logic for inactive tentacles
+        # Auto-grab and auto-drop logic for inactive tentacles. Idle arms that
+        # something could be touching check for it all at once.
+        waiting = self.intercepts.waiting(
+            self.tentacles, self.falling_ingredients, self.frame, dt
+        )
+        auto_grabs = dict(self.tentacles.find_grabbable(waiting, self.ingredient_grid))
         for tentacle in self.tentacles:
             if not tentacle.is_active:
                 if not tentacle.is_grabbing:
                     # Try to auto-grab nearby falling ingredients
-                    for ingredient in self.falling_ingredients:
-                        if ingredient.state == "falling" and tentacle.collides_with(ingredient):
-                            tentacle.set_grabbing(True)
-                            tentacle.grab_object(ingredient)
-                            ingredient.set_state("grabbed")
-                            break
+                    ingredient = auto_grabs.get(tentacle)
+                    if ingredient:
+                        tentacle.set_grabbing(True)
+                        tentacle.grab_object(ingredient)
+                        ingredient.set_state(INGREDIENT_GRABBED)
                 else:
                     # Move toward crust with grabbed ingredient
                     tentacle.set_target(self.pie_crust.position)
                     
                     # Check if over crust - auto-drop
-                    if self.pie_crust.collides_with(tentacle.grabbed_object):
+                    if self.intercepts.may_reach_crust(
+                        tentacle, self.pie_crust, self.frame
+                    ) and self.pie_crust.collides_with(tentacle.grabbed_object):
                         released = tentacle.release_object()
                         if released:
                             tentacle.set_grabbing(False)
-                            released.set_state("in_crust")
+                            released.set_state(INGREDIENT_IN_CRUST)
                             self.falling_ingredients.remove(released)
+                            self.ingredient_grid.remove(released)
                             self.pie_crust.add_ingredient(released)
                             self.ingredients_in_crust.append(released)
                             
@@ -190,54 +238,106 @@ class MinigameFilling(MinigameBase):
                             # Return to locked position
                             tentacle.set_target(tentacle.locked_position)
 
+        # Drop the holes left by ingredients that left play
+        self.falling_ingredients.compact()
+
         # Check if time is up
         if self.is_complete():
             return False
 
         return True
 
-    def draw(self, screen):
-        """Render the minigame."""
-        # Draw background
-        screen.fill(COLOR_BACKGROUND)
+    def add_ingredient(self, ingredient):
+        """Put a falling ingredient into play, after all the others."""
+        self.falling_ingredients.append(ingredient)
+        self.ingredient_grid.insert(ingredient, self.spawn_count)
+        self.spawn_count += 1
+        self.intercepts.add_falling(ingredient)
 
-        # Draw pie crust first (background layer)
-        self.pie_crust.draw(screen)
+    def store_previous_positions(self):
+        """Remember positions before a fixed step so drawing can interpolate."""
+        for tentacle in self.tentacles:
+            tentacle.store_previous_position()
+        for ingredient in self.falling_ingredients:
+            ingredient.store_previous_position()
 
-        # Draw octopus
-        self.octopus.draw(screen)
+    def draw(self, screen, alpha=1.0):
+        """Render the minigame.
 
-        # Draw all tentacles
-        for tentacle in self.tentacles:
-            tentacle.draw(screen)
+        Args:
+            screen: Surface to draw on
+            alpha: Fraction of the way from the previous simulation step to
+                the current one to draw moving objects at
+        """
+        self.draw_background(screen)
+        frame_profiler.mark("background")
+        self.draw_dynamic(screen, alpha)
 
-        # Draw falling ingredients
-        for ingredient in self.falling_ingredients:
-            ingredient.draw(screen)
+    def draw_background(self, surface):
+        """Draw the parts of the scene that never move."""
+        # Background, pie crust and octopus are baked into one layer
+        surface.blit(self.get_background(surface.get_size()), (0, 0))
+
+    def get_background(self, size):
+        """Get the cached static layer for a screen size."""
+        return static_layers.get(self, size)
+
+    def draw_dynamic(self, screen, alpha=1.0):
+        """Draw tentacles, ingredients and UI over the background.
+
+        Args:
+            screen: Surface to draw on
+            alpha: Interpolation between the last two simulation steps
+
+        Returns:
+            List of Rects covering everything drawn
+        """
+        rects = []
+
+        # Draw all tentacles, rebuilding moved curves together first
+        update_curves(self.tentacles, alpha)
+        for tentacle in self.tentacles:
+            rects.append(tentacle.draw(screen, alpha))
+        frame_profiler.mark("tentacles")
+
+        # Draw falling ingredients as one batch of sprites
+        if self.ingredient_sprites is None:
+            self.ingredient_sprites = IngredientSprites(self.recipe.color_table)
+        ingredient_rects = self.ingredient_sprites.draw(
+            screen, self.falling_ingredients, alpha
+        )
+        rects.extend(ingredient_rects)
+        frame_profiler.mark("ingredients")
 
         # Draw UI
-        self._draw_ui(screen)
+        rects.extend(self.draw_hud(screen, self.get_hud_state()))
+        frame_profiler.mark("ui")
+        return rects
 
     def _draw_instructions_overlay(self, screen):
-        """Draw the static instructions overlay."""
-        # Darker overlay since no interaction needed
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
-        
+        """Draw the static instructions overlay.
+
+        Returns:
+            List of Rects covering everything drawn
+        """
+        if self.instructions_overlay is None:
+            self.instructions_overlay = self._build_instructions_overlay()
+        return [self.instructions_overlay.draw(screen)]
+
+    def _build_instructions_overlay(self):
+        """Composite the darkened screen and instructions into one Overlay."""
+        center_x = SCREEN_WIDTH // 2
+
         # Large title
-        large_font = pygame.font.Font(None, 64)
-        title_text = large_font.render("HOW TO PLAY", True, (255, 255, 100))
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        screen.blit(title_text, title_rect)
-        
+        title_text = render_text(64, "HOW TO PLAY", (255, 255, 100))
+        texts = [(title_text, (center_x, 150))]
+
         # Instructions
         instructions = [
-            "Use your octopus's 4 arms to catch ingredients!",
+            f"Use your octopus's {self.num_tentacles} arms to catch ingredients!",
             "",
             "Controls:",
-            "  • Press 1-4 to switch between arms",
+            f"  • Press {self._switch_keys_hint()} to switch between arms",
             "  • Move mouse to control active arm",
             "  • Click to grab/release ingredients",
             "",
@@ -246,98 +346,132 @@ class MinigameFilling(MinigameBase):
             "  • Positioned arms auto-catch nearby ingredients",
             "  • Avoid wrong ingredients and rocks!",
         ]
-        
+
         y_offset = 240
         for instruction in instructions:
             if instruction:
-                inst_text = self.small_font.render(instruction, True, (255, 255, 255))
-                inst_rect = inst_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-                screen.blit(inst_text, inst_rect)
+                inst_text = render_text(
+                    UI_SMALL_FONT_SIZE, instruction, (255, 255, 255)
+                )
+                texts.append((inst_text, (center_x, y_offset)))
             y_offset += 32
-        
+
         # Skip prompt
-        skip_font = pygame.font.Font(None, 40)
-        skip_text = skip_font.render("Press SPACE to start!", True, (100, 255, 100))
-        skip_rect = skip_text.get_rect(center=(SCREEN_WIDTH // 2, 540))
-        screen.blit(skip_text, skip_rect)
-    
-    def _draw_countdown_overlay(self, screen):
-        """Draw the prep phase countdown (no overlay for full visibility)."""
+        skip_text = render_text(40, "Press SPACE to start!", (100, 255, 100))
+        texts.append((skip_text, (center_x, 540)))
+
+        # Darker overlay since no interaction needed
+        return Overlay(texts, dim_alpha=180)
+
+    def _draw_countdown_overlay(self, screen, countdown):
+        """Draw the prep phase countdown (no overlay for full visibility).
+
+        Args:
+            screen: Surface to draw on
+            countdown: Whole seconds to show
+
+        Returns:
+            List of Rects covering everything drawn
+        """
+        if countdown != self.countdown_shown:
+            self.countdown_overlay = self._build_countdown_overlay(countdown)
+            self.countdown_shown = countdown
+        return [self.countdown_overlay.draw(screen)]
+
+    def _build_countdown_overlay(self, countdown):
+        """Composite the prep phase title, reminder and a countdown value."""
+        center_x = SCREEN_WIDTH // 2
+
         # Large title
-        large_font = pygame.font.Font(None, 64)
-        title_text = large_font.render("POSITION YOUR ARMS!", True, (255, 255, 100))
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 250))
-        screen.blit(title_text, title_rect)
-        
+        title_text = render_text(64, "POSITION YOUR ARMS!", (255, 255, 100))
+
         # Quick reminder
-        reminder = "Press 1-4 to switch • Move mouse to position"
-        reminder_text = self.small_font.render(reminder, True, (255, 255, 255))
-        reminder_rect = reminder_text.get_rect(center=(SCREEN_WIDTH // 2, 320))
-        screen.blit(reminder_text, reminder_rect)
-        
+        keys = self._switch_keys_hint()
+        reminder = f"Press {keys} to switch • Move mouse to position"
+        reminder_text = render_text(UI_SMALL_FONT_SIZE, reminder, (255, 255, 255))
+
         # Countdown
-        countdown_font = pygame.font.Font(None, 96)
-        countdown = int(self.prep_time_remaining) + 1  # Shows 5,4,3,2,1
-        countdown_text = countdown_font.render(
-            str(countdown),
-            True,
-            COLOR_TIMER
+        countdown_text = render_text(96, str(countdown), COLOR_TIMER)
+        return Overlay(
+            [
+                (title_text, (center_x, 250)),
+                (reminder_text, (center_x, 320)),
+                (countdown_text, (center_x, 420)),
+            ]
         )
-        countdown_rect = countdown_text.get_rect(center=(SCREEN_WIDTH // 2, 420))
-        screen.blit(countdown_text, countdown_rect)
 
-    def _draw_ui(self, screen):
-        """Draw UI elements like timer, score, and requirements."""
+    def get_hud_state(self):
+        """Capture the values the UI shows, so it can be drawn later.
+
+        Returns:
+            HudState for draw_hud
+        """
+        return HudState(
+            self.instructions_phase,
+            self.prep_phase,
+            int(self.prep_time_remaining) + 1,  # Shows 5,4,3,2,1
+            int(self.get_remaining_time()),
+            self.score_tracker.get_score(),
+            tuple(
+                (ing_type, self.score_tracker.get_count(ing_type), required_count)
+                for ing_type, required_count in self.recipe.required_ingredients.items()
+            ),
+        )
+
+    def draw_hud(self, screen, hud):
+        """Draw UI elements like timer, score, and requirements.
+
+        Args:
+            screen: Surface to draw on
+            hud: HudState with the values to show
+
+        Returns:
+            List of Rects covering everything drawn
+        """
         # Draw instructions overlay if in instructions phase
-        if self.instructions_phase:
-            self._draw_instructions_overlay(screen)
-            return
-        
+        if hud.instructions_phase:
+            return self._draw_instructions_overlay(screen)
+
         # Draw countdown overlay if in prep phase
-        if self.prep_phase:
-            self._draw_countdown_overlay(screen)
-            return  # Don't draw normal UI during prep
-        
+        # (normal UI is hidden during prep)
+        if hud.prep_phase:
+            return self._draw_countdown_overlay(screen, hud.countdown)
+
+        rects = []
+
         # Draw timer
-        remaining_time = self.get_remaining_time()
-        timer_text = self.font.render(
-            f"Time: {int(remaining_time)}s", True, COLOR_TIMER
+        timer_text = render_text(
+            UI_FONT_SIZE, f"Time: {hud.remaining_time}s", COLOR_TIMER
         )
-        screen.blit(timer_text, (UI_MARGIN, UI_MARGIN))
+        rects.append(screen.blit(timer_text, (UI_MARGIN, UI_MARGIN)))
 
         # Draw recipe name
-        name_text = self.small_font.render(self.recipe.name, True, COLOR_UI_TEXT)
-        screen.blit(name_text, (UI_MARGIN, UI_MARGIN + 40))
+        name_text = render_text(UI_SMALL_FONT_SIZE, self.recipe.name, COLOR_UI_TEXT)
+        rects.append(screen.blit(name_text, (UI_MARGIN, UI_MARGIN + 40)))
 
         # Draw required ingredients
         y_offset = UI_MARGIN + 80
-        requirements_text = self.small_font.render("Required:", True, COLOR_UI_TEXT)
-        screen.blit(requirements_text, (UI_MARGIN, y_offset))
+        requirements_text = render_text(UI_SMALL_FONT_SIZE, "Required:", COLOR_UI_TEXT)
+        rects.append(screen.blit(requirements_text, (UI_MARGIN, y_offset)))
         y_offset += 30
 
-        for ing_type, required_count in self.recipe.required_ingredients.items():
-            # Count how many we have
-            collected_count = sum(
-                1
-                for ing in self.ingredients_in_crust
-                if ing.ingredient_type == ing_type
-            )
-            text = self.small_font.render(
+        for ing_type, collected_count, required_count in hud.requirements:
+            text = render_text(
+                UI_SMALL_FONT_SIZE,
                 f"{ing_type}: {collected_count}/{required_count}",
-                True,
                 COLOR_SCORE if collected_count >= required_count else COLOR_UI_TEXT,
             )
-            screen.blit(text, (UI_MARGIN + 20, y_offset))
+            rects.append(screen.blit(text, (UI_MARGIN + 20, y_offset)))
             y_offset += 25
 
-        # Draw current score (live calculation)
-        current_score = self.recipe.calculate_score(self.ingredients_in_crust)
-        score_text = self.font.render(f"Score: {current_score}", True, COLOR_SCORE)
-        screen.blit(score_text, (SCREEN_WIDTH - 200, UI_MARGIN))
+        # Draw current score (kept up to date as ingredients land)
+        score_text = render_text(UI_FONT_SIZE, f"Score: {hud.score}", COLOR_SCORE)
+        rects.append(screen.blit(score_text, (SCREEN_WIDTH - 200, UI_MARGIN)))
+        return rects
 
     def calculate_score(self):
         """Calculate final score (0-100)."""
-        self.score = self.recipe.calculate_score(self.ingredients_in_crust)
+        self.score = self.score_tracker.get_score()
         return self.score
 
     def get_summary(self):
@@ -345,28 +479,12 @@ class MinigameFilling(MinigameBase):
         # Calculate final score
         final_score = self.calculate_score()
 
-        # Count ingredients by type
-        ingredient_counts = {}
-        for ingredient in self.ingredients_in_crust:
-            ing_type = ingredient.ingredient_type
-            ingredient_counts[ing_type] = ingredient_counts.get(ing_type, 0) + 1
-
-        # Check which requirements were met
-        requirements_met = {}
-        for ing_type, required in self.recipe.required_ingredients.items():
-            collected = ingredient_counts.get(ing_type, 0)
-            requirements_met[ing_type] = {
-                "required": required,
-                "collected": collected,
-                "met": collected >= required,
-            }
-
         return {
             "score": final_score,
             "recipe_name": self.recipe.name,
-            "ingredients_collected": ingredient_counts,
-            "requirements_met": requirements_met,
-            "total_ingredients": len(self.ingredients_in_crust),
+            "ingredients_collected": dict(self.score_tracker.counts),
+            "requirements_met": self.score_tracker.get_requirements(),
+            "total_ingredients": self.score_tracker.total,
         }
 
     def handle_mouse_motion(self, pos):
@@ -389,23 +507,24 @@ class MinigameFilling(MinigameBase):
             self.prep_phase = True
             return
         
-        # Switch tentacle based on number key (1-4)
-        if key == pygame.K_1:
-            self._switch_tentacle(0)
-        elif key == pygame.K_2:
-            self._switch_tentacle(1)
-        elif key == pygame.K_3:
-            self._switch_tentacle(2)
-        elif key == pygame.K_4:
-            self._switch_tentacle(3)
+        # Switch tentacle based on number key (1-9, 0) or TAB
+        index = tentacle_for_key(key, self.active_tentacle_index, self.num_tentacles)
+        if index is not None:
+            self._switch_tentacle(index)
+
+    def _switch_keys_hint(self):
+        """Describe the keys that switch arms, for the on-screen help."""
+        if self.num_tentacles <= 9:
+            return f"1-{self.num_tentacles}"
+        return "1-0 or Tab"
 
     def _switch_tentacle(self, index):
         """Switch to the specified tentacle.
 
         Args:
-            index: The index of the tentacle to switch to (0-3)
+            index: The index of the tentacle to switch to
         """
-        if 0 <= index < NUM_TENTACLES and index != self.active_tentacle_index:
+        if 0 <= index < self.num_tentacles and index != self.active_tentacle_index:
             # Lock current tentacle's position
             current_tentacle = self.tentacles[self.active_tentacle_index]
             current_tentacle.is_active = False
@@ -0,0 +1,42 @@
+import pygame
+from display_setup import to_display_format
+from constants import *
+
+
+class Overlay:
+    """Text pre-composited onto one surface so a static screen is one blit.
+
+    Overlays are built once when the screen they show changes and then
+    blitted every frame, instead of rendering and blitting every line again.
+    """
+
+    def __init__(self, texts, dim_alpha=None):
+        """Composite text surfaces.
+
+        Args:
+            texts: List of (surface, center) pairs in screen coordinates
+            dim_alpha: Opacity of a black layer darkening the whole screen
+                behind the text, or None to only cover the text itself
+        """
+        rects = [text.get_rect(center=center) for text, center in texts]
+        if dim_alpha is not None:
+            self.rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        else:
+            self.rect = rects[0].unionall(rects[1:])
+
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        surface.fill((0, 0, 0, dim_alpha or 0))
+        for (text, _), rect in zip(texts, rects):
+            surface.blit(text, rect.move(-self.rect.x, -self.rect.y))
+        surface = to_display_format(surface, alpha=True)
+        # Run-length encoding lets blits skip the transparent areas quickly
+        surface.set_alpha(255, pygame.RLEACCEL)
+        self.surface = surface
+
+    def draw(self, screen):
+        """Blit the overlay.
+
+        Returns:
+            Rect covering the overlay
+        """
+        return screen.blit(self.surface, self.rect)
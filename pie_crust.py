@@ -1,7 +1,12 @@
 import pygame
 from game_object import GameObject
+from score_tracker import ScoreTracker
 from constants import *
 
+# Shades of the crust color, computed once instead of on every draw
+COLOR_CRUST_OUTLINE = tuple(max(0, c - 40) for c in COLOR_CRUST)
+COLOR_CRUST_INNER = tuple(min(255, c + 20) for c in COLOR_CRUST)
+
 
 class PieCrust(GameObject):
     """The pie crust where ingredients are dropped.
@@ -9,11 +14,13 @@ class PieCrust(GameObject):
     Positioned below the octopus to create the appearance of a workbench.
     """
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, recipe=None):
         super().__init__(x, y)
         self.width = PIE_CRUST_WIDTH
         self.height = PIE_CRUST_HEIGHT
         self.contents = []  # List of ingredients that landed in the crust
+        # Running score of the contents, when a recipe is given
+        self.score_tracker = ScoreTracker(recipe) if recipe else None
 
     def draw(self, screen):
         """Draw the pie crust as a rectangle."""
@@ -25,9 +32,7 @@ class PieCrust(GameObject):
             self.height,
         )
         pygame.draw.rect(screen, COLOR_CRUST, crust_rect)
-        pygame.draw.rect(
-            screen, tuple(max(0, c - 40) for c in COLOR_CRUST), crust_rect, 3
-        )
+        pygame.draw.rect(screen, COLOR_CRUST_OUTLINE, crust_rect, 3)
 
         # Draw the inner area (lighter)
         inner_rect = pygame.Rect(
@@ -36,9 +41,7 @@ class PieCrust(GameObject):
             self.width - 20,
             self.height - 20,
         )
-        pygame.draw.rect(
-            screen, tuple(min(255, c + 20) for c in COLOR_CRUST), inner_rect
-        )
+        pygame.draw.rect(screen, COLOR_CRUST_INNER, inner_rect)
 
     def update(self, dt):
         """Pie crust is stationary."""
@@ -47,6 +50,8 @@ class PieCrust(GameObject):
     def add_ingredient(self, ingredient):
         """Add an ingredient to the crust contents."""
         self.contents.append(ingredient)
+        if self.score_tracker:
+            self.score_tracker.add(ingredient)
 
     def get_contents(self):
         """Get the list of ingredients in the crust."""
@@ -1,6 +1,35 @@
 import json
+import os
 from constants import *
 
+# Categories an allowed ingredient can belong to
+INGREDIENT_CATEGORIES = ("good", "bad", "inedible")
+
+# Compiled recipes by absolute path, as (modification time, Recipe)
+_recipe_cache = {}
+
+
+def load_recipe(recipe_path):
+    """Get a compiled recipe, reading the file only if it changed.
+
+    Recipes are cached by path and modification time, so restarts and batch
+    runs share one parsed copy. Treat the returned Recipe as read-only.
+
+    Args:
+        recipe_path: Path to the recipe JSON file
+
+    Returns:
+        Recipe object
+    """
+    path = os.path.abspath(recipe_path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _recipe_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    recipe = Recipe(recipe_path)
+    _recipe_cache[path] = (mtime, recipe)
+    return recipe
+
 
 class Recipe:
     """Loads and manages recipe data from JSON configuration files."""
@@ -10,6 +39,9 @@ class Recipe:
 
         Args:
             recipe_path: Path to the recipe JSON file
+
+        Raises:
+            ValueError: If the recipe doesn't match the expected format
         """
         with open(recipe_path, "r") as f:
             data = json.load(f)
@@ -28,20 +60,81 @@ class Recipe:
             "rock": COLOR_ROCK,
         }
 
+        self._validate(recipe_path)
+        self._compile()
+
+    def _validate(self, recipe_path):
+        """Check the recipe fields once, when it is loaded."""
+
+        def fail(message):
+            raise ValueError(f"Invalid recipe {recipe_path}: {message}")
+
+        def is_number(value):
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+        if not isinstance(self.name, str):
+            fail("name must be a string")
+        if not is_number(self.duration) or self.duration <= 0:
+            fail("duration must be a positive number")
+        for field in ("required_ingredients", "allowed_ingredients", "spawn_rates"):
+            if not isinstance(getattr(self, field), dict):
+                fail(f"{field} must be an object")
+
+        for ing_type, data in self.allowed_ingredients.items():
+            if not isinstance(data, dict):
+                fail(f"allowed ingredient '{ing_type}' must be an object")
+            if not is_number(data.get("points", 0)):
+                fail(f"points for '{ing_type}' must be a number")
+            if data.get("category", "good") not in INGREDIENT_CATEGORIES:
+                fail(
+                    f"category for '{ing_type}' must be one of {INGREDIENT_CATEGORIES}"
+                )
+        for ing_type, count in self.required_ingredients.items():
+            if not isinstance(count, int) or isinstance(count, bool):
+                fail(f"required count for '{ing_type}' must be an integer")
+        for ing_type, rate in self.spawn_rates.items():
+            if not is_number(rate) or rate < 0:
+                fail(f"spawn rate for '{ing_type}' must be a non-negative number")
+
+    def _compile(self):
+        """Precompute lookup tables used every frame and on every spawn."""
+        # Ingredient types are interned to integer ids in allowed order
+        self.ingredient_types = list(self.allowed_ingredients)
+        self.type_ids = {
+            ing_type: type_id for type_id, ing_type in enumerate(self.ingredient_types)
+        }
+
+        # Per-type data, indexable by type id or looked up by type name
+        self.ingredient_data = {}
+        for ing_type, data in self.allowed_ingredients.items():
+            self.ingredient_data[ing_type] = {
+                "points": data.get("points", 0),
+                "category": data.get("category", "good"),
+                "color": self.ingredient_colors.get(ing_type, (200, 200, 200)),
+            }
+        self.points_table = [
+            self.ingredient_data[t]["points"] for t in self.ingredient_types
+        ]
+        self.category_table = [
+            self.ingredient_data[t]["category"] for t in self.ingredient_types
+        ]
+        self.color_table = [
+            self.ingredient_data[t]["color"] for t in self.ingredient_types
+        ]
+
+        # Spawnable types and their weights for the spawner's alias table
+        self.spawn_types = [
+            t for t in self.ingredient_types if self.get_spawn_probability(t) > 0
+        ]
+        self.spawn_weights = [self.get_spawn_probability(t) for t in self.spawn_types]
+
     def get_ingredient_data(self, ingredient_type):
         """Get data for a specific ingredient type.
 
         Returns:
-            dict with 'points', 'category', 'color' keys
+            dict with 'points', 'category', 'color' keys (shared, don't modify)
         """
-        if ingredient_type in self.allowed_ingredients:
-            data = self.allowed_ingredients[ingredient_type]
-            return {
-                "points": data.get("points", 0),
-                "category": data.get("category", "good"),
-                "color": self.ingredient_colors.get(ingredient_type, (200, 200, 200)),
-            }
-        return None
+        return self.ingredient_data.get(ingredient_type)
 
     def get_spawn_probability(self, ingredient_type):
         """Get the spawn probability for an ingredient type."""
@@ -0,0 +1,280 @@
+import argparse
+import hashlib
+import math
+import os
+import struct
+from multiprocessing import Pool
+from headless import HeadlessRunner, InputScript
+from recipe import load_recipe
+from constants import *
+
+# File layout: header, then one record per input event until end of file.
+#   header: magic, version, seed (u64), recipe hash (16 bytes), number of
+#           tentacles (u8), recipe path length (u16) and UTF-8 path
+#   event:  frame delta since the previous event (varint), event code (u8),
+#           then for motion the x/y change since the previous motion
+#           (zigzag varints) or for keys the key code (varint)
+REPLAY_MAGIC = b"OCTR"
+REPLAY_VERSION = 3
+_HEADER = struct.Struct("<4sBQ16sBH")
+
+_EVENT_MOTION = 0
+_EVENT_BUTTON_DOWN = 1
+_EVENT_BUTTON_UP = 2
+_EVENT_KEY = 3
+
+
+def recipe_hash(recipe_path):
+    """Hash a recipe file so replays can tell if it changed."""
+    with open(recipe_path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()[:16]
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, offset):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+
+def _unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+class Recording:
+    """A recorded filling round: seed, recipe, arm count and frame-indexed inputs.
+
+    Events use the same (frame, kind, value) tuples as InputScript.
+    """
+
+    def __init__(
+        self,
+        seed,
+        recipe_path,
+        events=None,
+        recipe_digest=None,
+        num_tentacles=NUM_TENTACLES,
+    ):
+        self.seed = seed
+        self.recipe_path = recipe_path
+        self.num_tentacles = num_tentacles
+        self.events = events if events is not None else []
+        self.recipe_digest = (
+            recipe_digest if recipe_digest is not None else recipe_hash(recipe_path)
+        )
+
+    def encode(self):
+        """Serialize the recording to the compact binary format."""
+        path = self.recipe_path.encode("utf-8")
+        out = bytearray(
+            _HEADER.pack(
+                REPLAY_MAGIC,
+                REPLAY_VERSION,
+                self.seed,
+                self.recipe_digest,
+                self.num_tentacles,
+                len(path),
+            )
+        )
+        out += path
+
+        last_frame = 0
+        last_x = 0
+        last_y = 0
+        for frame, kind, value in self.events:
+            _write_varint(out, frame - last_frame)
+            last_frame = frame
+            if kind == "motion":
+                x, y = value
+                out.append(_EVENT_MOTION)
+                _write_varint(out, _zigzag(x - last_x))
+                _write_varint(out, _zigzag(y - last_y))
+                last_x, last_y = x, y
+            elif kind == "button":
+                out.append(_EVENT_BUTTON_DOWN if value else _EVENT_BUTTON_UP)
+            elif kind == "key":
+                out.append(_EVENT_KEY)
+                _write_varint(out, value)
+            else:
+                raise ValueError(f"Unknown input kind: {kind}")
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data):
+        """Read a recording from bytes produced by encode()."""
+        magic, version = struct.unpack_from("<4sB", data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Not an Octopied replay")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {version}")
+        _, _, seed, digest, num_tentacles, path_length = _HEADER.unpack_from(data)
+        offset = _HEADER.size
+        recipe_path = data[offset : offset + path_length].decode("utf-8")
+        offset += path_length
+
+        events = []
+        frame = 0
+        x = 0
+        y = 0
+        while offset < len(data):
+            delta, offset = _read_varint(data, offset)
+            frame += delta
+            code = data[offset]
+            offset += 1
+            if code == _EVENT_MOTION:
+                dx, offset = _read_varint(data, offset)
+                dy, offset = _read_varint(data, offset)
+                x += _unzigzag(dx)
+                y += _unzigzag(dy)
+                events.append((frame, "motion", (x, y)))
+            elif code == _EVENT_BUTTON_DOWN:
+                events.append((frame, "button", True))
+            elif code == _EVENT_BUTTON_UP:
+                events.append((frame, "button", False))
+            elif code == _EVENT_KEY:
+                key, offset = _read_varint(data, offset)
+                events.append((frame, "key", key))
+            else:
+                raise ValueError(f"Unknown replay event code: {code}")
+        return cls(seed, recipe_path, events, digest, num_tentacles)
+
+    def save(self, path):
+        """Write the recording to a file."""
+        with open(path, "wb") as f:
+            f.write(self.encode())
+
+    @classmethod
+    def load(cls, path):
+        """Read a recording from a file."""
+        with open(path, "rb") as f:
+            return cls.decode(f.read())
+
+
+class InputRecorder:
+    """Records a minigame's inputs while forwarding them to it.
+
+    Use it in place of the minigame for the handle_* calls. Each event is
+    stamped with the minigame's update count, which is the frame a headless
+    replay applies it on.
+    """
+
+    def __init__(self, minigame, recipe_path):
+        """Start recording a minigame.
+
+        Args:
+            minigame: MinigameFilling being played
+            recipe_path: Path of the recipe it was built from
+        """
+        self.minigame = minigame
+        self.recording = Recording(
+            minigame.seed, recipe_path, num_tentacles=minigame.num_tentacles
+        )
+
+    def _record(self, kind, value):
+        self.recording.events.append((self.minigame.frame, kind, value))
+
+    def handle_mouse_motion(self, pos):
+        """Record and forward a mouse motion."""
+        pos = (int(pos[0]), int(pos[1]))
+        self._record("motion", pos)
+        self.minigame.handle_mouse_motion(pos)
+
+    def handle_mouse_button(self, pressed):
+        """Record and forward a mouse button change."""
+        self._record("button", bool(pressed))
+        self.minigame.handle_mouse_button(pressed)
+
+    def handle_key_press(self, key):
+        """Record and forward a key press."""
+        self._record("key", key)
+        self.minigame.handle_key_press(key)
+
+
+def replay(recording, recipe_path=None):
+    """Play a recording back headlessly as fast as possible.
+
+    Args:
+        recording: Recording to play
+        recipe_path: Recipe to use instead of the recorded path
+
+    Returns:
+        The HeadlessRunner after the run, holding the minigame and timings
+    """
+    recipe_path = recipe_path or recording.recipe_path
+    if recipe_hash(recipe_path) != recording.recipe_digest:
+        raise ValueError(f"Recipe {recipe_path} changed since the round was recorded")
+
+    script = InputScript(recording.events)
+    last_frame = recording.events[-1][0] if recording.events else 0
+    round_time = PREP_PHASE_DURATION + load_recipe(recipe_path).duration
+    runner = HeadlessRunner(
+        recipe_path,
+        script,
+        seed=recording.seed,
+        num_tentacles=recording.num_tentacles,
+        start_immediately=False,
+        max_frames=last_frame + math.ceil(round_time / FIXED_DT) + 1,
+    )
+    runner.run()
+    return runner
+
+
+def rescore_file(path):
+    """Replay one file and return its path and summary. Runs in a worker."""
+    runner = replay(Recording.load(path))
+    return path, runner.minigame.get_summary()
+
+
+def rescore(paths, workers=None):
+    """Replay many recordings in parallel.
+
+    Yields:
+        (path, summary) tuples in the order the replays finish
+    """
+    with Pool(workers) as pool:
+        yield from pool.imap_unordered(rescore_file, paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score recorded rounds")
+    parser.add_argument("replays", nargs="+", help="Replay files or directories")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    paths = []
+    for path in args.replays:
+        if os.path.isdir(path):
+            paths.extend(
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if name.endswith(".octr")
+            )
+        else:
+            paths.append(path)
+
+    scores = []
+    for path, summary in rescore(paths, args.workers):
+        scores.append(summary["score"])
+        print(f"{path}: {summary['score']}/100")
+    if scores:
+        print(f"\nRe-scored {len(scores)} rounds, mean {sum(scores) / len(scores):.2f}")
+
+
+if __name__ == "__main__":
+    main()
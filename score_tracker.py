@@ -0,0 +1,75 @@
+from constants import *
+
+
+class ScoreTracker:
+    """Keeps a running score for the ingredients added to a pie crust.
+
+    Every add is O(1), and get_score() always equals
+    Recipe.calculate_score() over the same ingredients.
+    """
+
+    def __init__(self, recipe):
+        """Start an empty tally for a recipe.
+
+        Args:
+            recipe: Recipe whose points and requirements are scored
+        """
+        self.recipe = recipe
+        self.points = 0
+        self.total = 0
+        self.counts = {}  # Ingredient type -> count, in the order first added
+        self.total_requirements = len(recipe.required_ingredients)
+        # Requirements of zero or less are met from the start
+        self.requirements_met = sum(
+            1 for required in recipe.required_ingredients.values() if required <= 0
+        )
+
+    def add(self, ingredient):
+        """Count an ingredient that landed in the crust."""
+        self.add_type(ingredient.ingredient_type, ingredient.points)
+
+    def add_type(self, ingredient_type, points, count=1):
+        """Count ingredients of one type.
+
+        Args:
+            ingredient_type: String ID like "apple"
+            points: Points for one ingredient of this type
+            count: How many were added
+        """
+        before = self.counts.get(ingredient_type, 0)
+        after = before + count
+        self.counts[ingredient_type] = after
+        self.points += points * count
+        self.total += count
+
+        required = self.recipe.required_ingredients.get(ingredient_type)
+        if required is not None and before < required <= after:
+            self.requirements_met += 1
+
+    def get_count(self, ingredient_type):
+        """Get how many of an ingredient type have been added."""
+        return self.counts.get(ingredient_type, 0)
+
+    def get_score(self):
+        """Get the current score, from 0-100."""
+        score = self.points
+        if self.total_requirements > 0:
+            completion_bonus = (self.requirements_met / self.total_requirements) * 50
+            score += completion_bonus
+        return int(max(0, min(MINIGAME_MAX_SCORE, score)))
+
+    def get_requirements(self):
+        """Get progress toward each required ingredient.
+
+        Returns:
+            dict of type -> {"required", "collected", "met"}
+        """
+        requirements = {}
+        for ing_type, required in self.recipe.required_ingredients.items():
+            collected = self.counts.get(ing_type, 0)
+            requirements[ing_type] = {
+                "required": required,
+                "collected": collected,
+                "met": collected >= required,
+            }
+        return requirements
@@ -0,0 +1,216 @@
+import queue
+import threading
+import time
+from collections import namedtuple
+from frame_profiler import frame_profiler
+from headless import apply_input
+from ingredient import Ingredient
+from ingredient_sprites import IngredientSprites
+from tentacle import Tentacle, tentacle_angles, update_curves
+from constants import *
+
+# One simulation step as published to the render loop. Tentacles are
+# (previous x, previous y, x, y, is_active, is_grabbing) tuples, ingredients
+# (previous x, previous y, x, y, color) tuples and hud a HudState. time is
+# the perf_counter() reading when the step was published.
+Snapshot = namedtuple(
+    "Snapshot", ["frame", "time", "tentacles", "ingredients", "hud", "complete"]
+)
+
+
+def take_snapshot(minigame, complete=False):
+    """Copy everything the render loop draws out of a minigame.
+
+    Args:
+        minigame: MinigameFilling after a step
+        complete: Whether the round ended on this step
+
+    Returns:
+        Snapshot holding only immutable values
+    """
+    tentacles = tuple(
+        (
+            tentacle.previous_position.x,
+            tentacle.previous_position.y,
+            tentacle.position.x,
+            tentacle.position.y,
+            tentacle.is_active,
+            tentacle.is_grabbing,
+        )
+        for tentacle in minigame.tentacles
+    )
+    ingredients = tuple(
+        (
+            ingredient.previous_position.x,
+            ingredient.previous_position.y,
+            ingredient.position.x,
+            ingredient.position.y,
+            ingredient.color,
+        )
+        for ingredient in minigame.falling_ingredients
+    )
+    return Snapshot(
+        minigame.frame,
+        time.perf_counter(),
+        tentacles,
+        ingredients,
+        minigame.get_hud_state(),
+        complete,
+    )
+
+
+class SimulationThread:
+    """Steps a minigame at a fixed rate on its own thread.
+
+    The render loop forwards input through the handle_* methods, which queue
+    it for the start of the next step, and draws from `snapshot`. Snapshots
+    are double buffered: each step builds a new immutable Snapshot while the
+    render loop still reads the previous one, then publishes it with a
+    single reference assignment. Neither side ever waits on a lock, so slow
+    frames or vsync waits don't hold up the simulation.
+
+    Only the simulation thread touches the minigame's state while running.
+    Once `snapshot.complete` is set the thread has stopped and the minigame
+    can be used directly again.
+    """
+
+    def __init__(self, minigame, controls=None):
+        """Prepare a simulation thread.
+
+        Args:
+            minigame: MinigameFilling to step
+            controls: Receiver for input, such as an InputRecorder wrapping
+                the minigame; the minigame itself if None
+        """
+        self.minigame = minigame
+        self.controls = controls if controls is not None else minigame
+        self.inputs = queue.SimpleQueue()
+        self.snapshot = take_snapshot(minigame)
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+
+    def start(self):
+        """Start stepping."""
+        self.thread.start()
+
+    def stop(self):
+        """Stop stepping and wait for the thread to finish."""
+        self.stopping.set()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def handle_mouse_motion(self, pos):
+        """Queue a mouse motion for the next step."""
+        self.inputs.put(("motion", pos))
+
+    def handle_mouse_button(self, pressed):
+        """Queue a mouse button change for the next step."""
+        self.inputs.put(("button", pressed))
+
+    def handle_key_press(self, key):
+        """Queue a key press for the next step."""
+        self.inputs.put(("key", key))
+
+    def get_alpha(self, snapshot):
+        """Interpolation for drawing a snapshot now, between its two steps."""
+        return min((time.perf_counter() - snapshot.time) / FIXED_DT, 1.0)
+
+    def _apply_inputs(self):
+        """Forward all queued input to the controls, in arrival order."""
+        while True:
+            try:
+                kind, value = self.inputs.get_nowait()
+            except queue.Empty:
+                return
+            apply_input(self.controls, kind, value)
+
+    def _run(self):
+        next_step = time.perf_counter()
+        while not self.stopping.is_set():
+            now = time.perf_counter()
+            if now < next_step:
+                self.stopping.wait(next_step - now)
+                continue
+            # Give up on time lost to hitches, like the main loop's accumulator
+            next_step = max(next_step, now - MAX_FRAME_TIME)
+
+            self._apply_inputs()
+            self.minigame.store_previous_positions()
+            continue_game = self.minigame.update(FIXED_DT)
+            complete = not continue_game or self.minigame.is_complete()
+            self.snapshot = take_snapshot(self.minigame, complete)
+            next_step += FIXED_DT
+            if complete:
+                return
+
+
+class SnapshotScene:
+    """Draws a minigame from simulation snapshots instead of its live state.
+
+    Has the get_background and draw_dynamic methods DirtyRectRenderer
+    expects, so it draws in place of the minigame. Tentacles and
+    ingredients are drawn with the normal draw code through stand-in
+    objects owned by the render loop, refilled from each snapshot.
+    """
+
+    def __init__(self, minigame):
+        """Create a scene for a minigame.
+
+        Args:
+            minigame: MinigameFilling providing the static layer and UI
+        """
+        self.minigame = minigame
+        self.snapshot = None
+        self.tentacles = [
+            Tentacle(minigame.octopus, i, angle)
+            for i, angle in enumerate(tentacle_angles(minigame.num_tentacles))
+        ]
+        self.ingredients = []
+        self.ingredient_sprites = IngredientSprites(minigame.recipe.color_table)
+
+    def set_snapshot(self, snapshot):
+        """Choose the snapshot the next draw shows."""
+        self.snapshot = snapshot
+
+    def get_background(self, size):
+        """Get the minigame's static layer."""
+        return self.minigame.get_background(size)
+
+    def draw_dynamic(self, screen, alpha=1.0):
+        """Draw the snapshot's tentacles, ingredients and UI.
+
+        Args:
+            screen: Surface to draw on
+            alpha: Interpolation between the snapshot's two steps
+
+        Returns:
+            List of Rects covering everything drawn
+        """
+        snapshot = self.snapshot
+        rects = []
+
+        for tentacle, state in zip(self.tentacles, snapshot.tentacles):
+            previous_x, previous_y, x, y, is_active, is_grabbing = state
+            tentacle.previous_position.update(previous_x, previous_y)
+            tentacle.position.update(x, y)
+            tentacle.is_active = is_active
+            tentacle.is_grabbing = is_grabbing
+        update_curves(self.tentacles, alpha)
+        for tentacle in self.tentacles:
+            rects.append(tentacle.draw(screen, alpha))
+        frame_profiler.mark("tentacles")
+
+        while len(self.ingredients) < len(snapshot.ingredients):
+            self.ingredients.append(Ingredient(0, 0, None, None, 0, None))
+        ingredients = self.ingredients[: len(snapshot.ingredients)]
+        for ingredient, state in zip(ingredients, snapshot.ingredients):
+            previous_x, previous_y, x, y, color = state
+            ingredient.previous_position.update(previous_x, previous_y)
+            ingredient.position.update(x, y)
+            ingredient.color = color
+        rects.extend(self.ingredient_sprites.draw(screen, ingredients, alpha))
+        frame_profiler.mark("ingredients")
+
+        rects.extend(self.minigame.draw_hud(screen, snapshot.hud))
+        frame_profiler.mark("ui")
+        return rects
@@ -0,0 +1,98 @@
+import math
+
+
+class SpatialGrid:
+    """Uniform grid that buckets objects by position for neighbour queries.
+
+    Objects are inserted with increasing ordering keys and queries return
+    candidates sorted by them, so callers that want the first match in
+    insertion order get the same answer as a linear scan of their list.
+    """
+
+    # Below this many objects a query just returns all of them, which is
+    # cheaper than visiting the surrounding cells
+    SMALL_GRID_SIZE = 9
+
+    def __init__(self, cell_size):
+        """Create an empty grid.
+
+        Args:
+            cell_size: Width and height of each cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> {obj: order}
+        self.entries = {}  # obj -> (cell, order), in insertion order
+        self.last_order = None
+
+    def _cell_of(self, position):
+        return (
+            math.floor(position[0] / self.cell_size),
+            math.floor(position[1] / self.cell_size),
+        )
+
+    def insert(self, obj, order):
+        """Add an object at its current position.
+
+        Args:
+            obj: Object with a position attribute
+            order: Sort key used to order query results, greater than the
+                key of every earlier insert
+        """
+        if self.last_order is not None and order <= self.last_order:
+            raise ValueError("Grid objects must be inserted in increasing order")
+        self.last_order = order
+        cell = self._cell_of(obj.position)
+        self.cells.setdefault(cell, {})[obj] = order
+        self.entries[obj] = (cell, order)
+
+    def remove(self, obj):
+        """Remove an object if it is in the grid."""
+        entry = self.entries.pop(obj, None)
+        if entry is None:
+            return
+        cell = entry[0]
+        bucket = self.cells[cell]
+        del bucket[obj]
+        if not bucket:
+            del self.cells[cell]
+
+    def move(self, obj):
+        """Re-bucket an object after its position changed."""
+        cell, order = self.entries[obj]
+        new_cell = self._cell_of(obj.position)
+        if new_cell != cell:
+            bucket = self.cells[cell]
+            del bucket[obj]
+            if not bucket:
+                del self.cells[cell]
+            self.cells.setdefault(new_cell, {})[obj] = order
+            self.entries[obj] = (new_cell, order)
+
+    def query(self, position, radius):
+        """Find objects in cells overlapping a circle.
+
+        This is a broadphase: results may include objects outside the
+        radius, so callers still run their exact collision test.
+
+        Returns:
+            List of objects sorted by insertion order
+        """
+        if len(self.entries) <= self.SMALL_GRID_SIZE:
+            return list(self.entries)
+
+        min_x, min_y = self._cell_of((position[0] - radius, position[1] - radius))
+        max_x, max_y = self._cell_of((position[0] + radius, position[1] + radius))
+        found = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if bucket:
+                    found.extend(bucket.items())
+        found.sort(key=lambda item: item[1])
+        return [obj for obj, _ in found]
+
+    def __contains__(self, obj):
+        return obj in self.entries
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,40 @@
+import pygame
+from display_setup import to_display_format
+from constants import *
+
+
+class StaticLayerCache:
+    """Keeps the baked background, crust and octopus surface.
+
+    The layer only depends on the recipe and the screen size, so it is
+    built once and shared by every minigame (including restarts) until one
+    of those changes.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.surface = None
+
+    def get(self, minigame, size):
+        """Get the static layer for a minigame, building it if needed.
+
+        Args:
+            minigame: MinigameFilling whose crust and octopus are baked in
+            size: (width, height) of the target screen
+
+        Returns:
+            pygame.Surface with the background, crust and octopus drawn
+        """
+        key = (minigame.recipe.name, tuple(size))
+        if key != self.key:
+            surface = pygame.Surface(size)
+            surface.fill(COLOR_BACKGROUND)
+            minigame.pie_crust.draw(surface)
+            minigame.octopus.draw(surface)
+            self.surface = to_display_format(surface)
+            self.key = key
+        return self.surface
+
+
+# Shared by all minigames
+static_layers = StaticLayerCache()
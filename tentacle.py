@@ -1,7 +1,25 @@
+import numpy as np
 import pygame
+from bezier import segments_for_length, tessellate
 from game_object import GameObject
+from text_cache import render_text
 from constants import *
 
+# Number keys that select arms one to ten, and the key that cycles arms
+TENTACLE_SELECT_KEYS = [
+    pygame.K_1,
+    pygame.K_2,
+    pygame.K_3,
+    pygame.K_4,
+    pygame.K_5,
+    pygame.K_6,
+    pygame.K_7,
+    pygame.K_8,
+    pygame.K_9,
+    pygame.K_0,
+]
+TENTACLE_CYCLE_KEY = pygame.K_TAB
+
 
 class Tentacle(GameObject):
     """A tentacle that extends from the octopus to follow the mouse.
@@ -14,7 +32,7 @@ class Tentacle(GameObject):
 
         Args:
             octopus: The octopus object this tentacle is attached to
-            tentacle_id: Unique ID for this tentacle (0-3)
+            tentacle_id: Unique ID for this tentacle, its index in the group
             angle: Starting angle in degrees from top (clockwise)
         """
         # Calculate initial position based on angle
@@ -35,6 +53,13 @@ class Tentacle(GameObject):
         self.is_active = False
         self.auto_grabbing = False  # For inactive tentacles
 
+        # TentacleGroup whose arrays mirror this tentacle, if any
+        self.group = None
+
+        # Tessellated curve, reused until the tip moves noticeably
+        self.curve_points = None
+        self.curve_anchor = None
+
     def update(self, dt):
         """Update tentacle position with smoothing toward target."""
         # Lerp (linear interpolation) toward target position
@@ -43,64 +68,77 @@ class Tentacle(GameObject):
         smoothing_factor = min(smoothing_factor, 1.0)  # Clamp to max 1.0
 
         self.position += (self.target_position - self.position) * smoothing_factor
+        if self.group is not None:
+            self.group.sync(self)
 
     def set_target(self, target_pos):
         """Set the target position for the tentacle tip to move toward."""
-        self.target_position = pygame.Vector2(target_pos)
+        self.target_position.update(target_pos)
+        if self.group is not None:
+            self.group.targets[self.tentacle_id] = (
+                self.target_position.x,
+                self.target_position.y,
+            )
 
     def lock_position(self):
         """Lock the tentacle at its current position when becoming inactive."""
         self.locked_position = self.position.copy()
-        self.target_position = self.locked_position.copy()
+        self.set_target(self.locked_position)
 
     def set_grabbing(self, is_grabbing):
         """Set whether the tentacle is in grabbing mode."""
         self.is_grabbing = is_grabbing
 
     def grab_object(self, obj):
-        """Attach an object to the tentacle."""
+        """Attach an object to the tentacle and make it the object's holder."""
         self.grabbed_object = obj
+        obj.holder = self
 
     def release_object(self):
         """Release the currently grabbed object."""
         obj = self.grabbed_object
         self.grabbed_object = None
+        if obj is not None:
+            obj.holder = None
         return obj
 
-    def draw(self, screen):
-        """Draw the tentacle as a quadratic Bezier curve."""
-        # Calculate control point for Bezier curve (midpoint, slightly offset)
-        start = self.octopus.position
-        end = self.position
-
-        # Control point is between start and end, offset perpendicular to create curve
-        mid = (start + end) / 2
-        # Offset perpendicular to the line
-        direction = end - start
-        if direction.length() > 0:
-            perpendicular = pygame.Vector2(-direction.y, direction.x).normalize()
-            # Offset by 20% of the distance for a nice curve
-            offset = direction.length() * 0.2
-            control = mid + perpendicular * offset
-        else:
-            control = mid
+    def curve_is_stale(self, tip):
+        """Check if the tip moved too far from where the curve was built.
+
+        Args:
+            tip: Position the tip will be drawn at
+        """
+        if self.curve_anchor is None:
+            return True
+        return tip.distance_squared_to(self.curve_anchor) > TENTACLE_CURVE_TOLERANCE**2
+
+    def draw(self, screen, alpha=1.0):
+        """Draw the tentacle as a quadratic Bezier curve.
+
+        Args:
+            screen: Surface to draw on
+            alpha: Interpolation between the last two simulation steps
+
+        Returns:
+            Rect covering everything drawn
+        """
+        tip = self.get_render_position(alpha)
 
         # Choose color based on active state
         tentacle_color = COLOR_TENTACLE if self.is_active else TENTACLE_INACTIVE_COLOR
         line_width = 8 if self.is_active else 5
 
         # Draw the Bezier curve using multiple line segments
-        points = []
-        segments = 20
-        for i in range(segments + 1):
-            t = i / segments
-            # Quadratic Bezier formula: B(t) = (1-t)²P0 + 2(1-t)tP1 + t²P2
-            point = (1 - t) ** 2 * start + 2 * (1 - t) * t * control + t**2 * end
-            points.append((int(point.x), int(point.y)))
+        if self.curve_is_stale(tip):
+            update_curves([self], alpha)
+        points = self.curve_points
 
         # Draw the curve
+        rects = []
         if len(points) > 1:
-            pygame.draw.lines(screen, tentacle_color, False, points, line_width)
+            rects.append(
+                pygame.draw.lines(screen, tentacle_color, False, points, line_width)
+            )
 
         # Draw the tip (larger circle)
         if self.is_grabbing:
@@ -108,10 +146,10 @@ class Tentacle(GameObject):
         else:
             tip_color = tentacle_color
 
-        pygame.draw.circle(
+        tip_rect = pygame.draw.circle(
             screen,
             tip_color,
-            (int(self.position.x), int(self.position.y)),
+            (int(tip.x), int(tip.y)),
             self.tip_radius,
         )
 
@@ -119,28 +157,28 @@ class Tentacle(GameObject):
         pygame.draw.circle(
             screen,
             COLOR_OCTOPUS,
-            (int(self.position.x), int(self.position.y)),
+            (int(tip.x), int(tip.y)),
             self.tip_radius // 2,
         )
 
         # Draw tentacle number
-        font = pygame.font.Font(None, 20)
-        number_text = font.render(str(self.tentacle_id + 1), True, (255, 255, 255))
-        text_rect = number_text.get_rect(
-            center=(int(self.position.x), int(self.position.y))
-        )
+        number_text = render_text(20, str(self.tentacle_id + 1), (255, 255, 255))
+        text_rect = number_text.get_rect(center=(int(tip.x), int(tip.y)))
         screen.blit(number_text, text_rect)
-        
+
         # Draw auto-grab range indicator for inactive tentacles
         if not self.is_active and not self.is_grabbing:
             # Draw a subtle circle showing the grab range
-            pygame.draw.circle(
+            range_rect = pygame.draw.circle(
                 screen,
                 (*tentacle_color[:2], tentacle_color[2], 50),  # Semi-transparent
-                (int(self.position.x), int(self.position.y)),
+                (int(tip.x), int(tip.y)),
                 self.tip_radius * 2,
-                1  # Line width
+                1,  # Line width
             )
+            rects.append(range_rect)
+
+        return tip_rect.unionall(rects)
 
     def collides_with_point(self, point):
         """Check if a point collides with the tentacle tip."""
@@ -153,3 +191,182 @@ class Tentacle(GameObject):
             distance = self.position.distance_to(other.position)
             return distance <= (self.tip_radius + other.radius)
         return False
+
+    def find_grabbable(self, grid, taken=()):
+        """Find the first falling ingredient in the grid the tip touches.
+
+        Args:
+            grid: SpatialGrid of ingredients, ordered like falling_ingredients
+            taken: Ingredients to skip, already claimed by other arms
+
+        Returns:
+            The ingredient, or None if nothing is in reach
+        """
+        reach = self.tip_radius + INGREDIENT_RADIUS
+        for ingredient in grid.query(self.position, reach):
+            if ingredient.state != INGREDIENT_FALLING or ingredient in taken:
+                continue
+            if self.collides_with(ingredient):
+                return ingredient
+        return None
+
+
+def tentacle_angles(num_tentacles):
+    """Starting angles for a number of arms, spread around the octopus.
+
+    Arms are TENTACLE_ANGLE_STEP degrees apart, or closer when that many
+    wouldn't fit in a full circle.
+
+    Returns:
+        List of angles in degrees, clockwise from top
+    """
+    step = min(TENTACLE_ANGLE_STEP, 360 / num_tentacles)
+    return [TENTACLE_FIRST_ANGLE + i * step for i in range(num_tentacles)]
+
+
+def tentacle_for_key(key, active_index, num_tentacles):
+    """Find which arm a key press selects.
+
+    Number keys 1-9 and 0 pick arms one to ten directly and TAB cycles to
+    the next arm, which reaches every arm however many there are.
+
+    Returns:
+        Index of the selected arm, or None if the key doesn't select one
+    """
+    if key == TENTACLE_CYCLE_KEY:
+        return (active_index + 1) % num_tentacles
+    if key in TENTACLE_SELECT_KEYS:
+        index = TENTACLE_SELECT_KEYS.index(key)
+        if index < num_tentacles:
+            return index
+    return None
+
+
+class TentacleGroup:
+    """All of an octopus's arms, with their tips and targets in arrays.
+
+    Tentacle objects still carry the per-arm state, but from
+    TENTACLE_BATCH_MIN arms up the group keeps every tip and target in
+    arrays and steps the smoothing for all arms in one vectorised update.
+    Smaller groups step each arm on its own, which is cheaper than the
+    NumPy call overhead. Either way the inactive arms' auto-grab checks run
+    together in one pass over the spatial grid.
+    """
+
+    def __init__(self, octopus, num_tentacles=NUM_TENTACLES):
+        """Create the arms at their starting angles.
+
+        Args:
+            octopus: The octopus the arms are attached to
+            num_tentacles: Number of arms
+        """
+        if num_tentacles < 1:
+            raise ValueError("An octopus needs at least one tentacle")
+        self.tentacles = [
+            Tentacle(octopus, i, angle)
+            for i, angle in enumerate(tentacle_angles(num_tentacles))
+        ]
+        self.batched = num_tentacles >= TENTACLE_BATCH_MIN
+        # Tip and target arrays, only kept (and only valid) when batched
+        self.positions = None
+        self.targets = None
+        if self.batched:
+            self.positions = np.array([tuple(t.position) for t in self.tentacles])
+            self.targets = self.positions.copy()
+            # Targets set on the arms are mirrored into self.targets
+            for tentacle in self.tentacles:
+                tentacle.group = self
+
+    def update(self, dt):
+        """Move every tip toward its target, like Tentacle.update."""
+        if not self.batched:
+            for tentacle in self.tentacles:
+                tentacle.update(dt)
+            return
+
+        smoothing_factor = min(TENTACLE_SMOOTHING * dt, 1.0)
+        self.positions += (self.targets - self.positions) * smoothing_factor
+        for tentacle, (x, y) in zip(self.tentacles, self.positions.tolist()):
+            tentacle.position.update(x, y)
+
+    def sync(self, tentacle):
+        """Copy an arm's tip into the arrays after it moved on its own.
+
+        Tentacle.update calls this, so it only needs calling after writing
+        to a batched arm's position directly.
+        """
+        self.positions[tentacle.tentacle_id] = (
+            tentacle.position.x,
+            tentacle.position.y,
+        )
+
+    def find_grabbable(self, tentacles, grid):
+        """Find what each of several idle arms would grab, in order.
+
+        Gives the same result as calling find_grabbable on each arm in turn
+        and grabbing its match before checking the next arm.
+
+        Args:
+            tentacles: Arms to check, in the order they get to grab
+            grid: SpatialGrid of the ingredients in play
+
+        Returns:
+            List of (tentacle, ingredient) pairs for arms that found one
+        """
+        pairs = []
+        taken = set()
+        for tentacle in tentacles:
+            ingredient = tentacle.find_grabbable(grid, taken)
+            if ingredient is not None:
+                taken.add(ingredient)
+                pairs.append((tentacle, ingredient))
+        return pairs
+
+    def __getitem__(self, index):
+        return self.tentacles[index]
+
+    def __iter__(self):
+        return iter(self.tentacles)
+
+    def __len__(self):
+        return len(self.tentacles)
+
+
+def update_curves(tentacles, alpha=1.0):
+    """Rebuild the curve points of every stale tentacle in one batch.
+
+    Each arm is a quadratic Bezier from the octopus to the tip, with the
+    control point pushed out perpendicular to the arm so it bends. Curves
+    with the same segment count are evaluated together.
+
+    Args:
+        tentacles: Iterable of Tentacle objects
+        alpha: Interpolation between the last two simulation steps
+    """
+    stale = []
+    tips = []
+    for tentacle in tentacles:
+        tip = tentacle.get_render_position(alpha)
+        if tentacle.curve_is_stale(tip):
+            stale.append(tentacle)
+            tips.append(tuple(tip))
+    if not stale:
+        return
+
+    starts = np.array([tuple(tentacle.octopus.position) for tentacle in stale])
+    ends = np.array(tips)
+    direction = ends - starts
+    # Perpendicular offset of TENTACLE_CURVE_BEND times the arm length
+    perpendicular = np.stack([-direction[:, 1], direction[:, 0]], axis=1)
+    controls = (starts + ends) / 2 + perpendicular * TENTACLE_CURVE_BEND
+    control_points = np.stack([starts, controls, ends], axis=1)
+
+    lengths = np.hypot(direction[:, 0], direction[:, 1])
+    segment_counts = [segments_for_length(length) for length in lengths]
+    for segments in set(segment_counts):
+        group = [i for i, count in enumerate(segment_counts) if count == segments]
+        curves = tessellate(control_points[group], segments).astype(int)
+        for index, points in zip(group, curves.tolist()):
+            tentacle = stale[index]
+            tentacle.curve_points = [tuple(point) for point in points]
+            tentacle.curve_anchor = pygame.Vector2(tips[index])
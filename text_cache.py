@@ -0,0 +1,29 @@
+import functools
+import pygame
+from display_setup import to_display_format
+from constants import *
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(size):
+    """Get the default font at a size, loading it only once."""
+    if not pygame.font.get_init():
+        pygame.font.init()
+    return pygame.font.Font(None, size)
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def render_text(size, text, color):
+    """Render antialiased text, reusing the surface for repeated strings.
+
+    Surfaces are shared between callers, so blit them but never draw on them.
+
+    Args:
+        size: Font size in points
+        text: String to render
+        color: RGB tuple
+
+    Returns:
+        pygame.Surface with the rendered text, in the display's pixel format
+    """
+    return to_display_format(get_font(size).render(text, True, color), alpha=True)